@@ -1,33 +1,17 @@
 """CLI entry point for pen-audit."""
 
 import argparse
-import json
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
-from .utils import c, print_box, print_table
+from .utils import c, dump_json, dump_json_bytes, print_box, print_table
 
 
-def create_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        prog="pen-audit",
-        description="pen-audit — design file feature scanner for .pen files",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-examples:
-  pen-audit scan design-export.json
-  pen-audit scan design-export.json --format markdown
-  pen-audit status
-  pen-audit show screen
-  pen-audit show "Food Log"
-  pen-audit next
-  pen-audit resolve screen::abc123::FoodLog --status implemented
-  pen-audit plan --format all --output ./output/
-""",
-    )
-
-    sub = parser.add_subparsers(dest="command", required=True)
-
+def _add_scan_parser(sub):
     # scan: run all detectors
     p_scan = sub.add_parser("scan", help="Scan a .pen export and detect UI features")
     p_scan.add_argument("file", type=str, help="Path to .pen JSON export file")
@@ -36,11 +20,15 @@ examples:
                         choices=["summary", "json", "markdown"],
                         help="Output format (default: summary)")
 
+
+def _add_status_parser(sub):
     # status: show completion dashboard
     p_status = sub.add_parser("status", help="Show completion dashboard")
     p_status.add_argument("--state", type=str, default=None)
     p_status.add_argument("--json", action="store_true")
 
+
+def _add_show_parser(sub):
     # show: dig into features
     p_show = sub.add_parser("show", help="Show detected features by detector, screen, or pattern")
     p_show.add_argument("pattern", nargs="?", default=None,
@@ -49,18 +37,24 @@ examples:
     p_show.add_argument("--status", choices=["open", "implemented", "deferred", "all"],
                         default="all")
 
+
+def _add_next_parser(sub):
     # next: suggest next feature to implement
     p_next = sub.add_parser("next", help="Suggest next feature to implement")
     p_next.add_argument("--state", type=str, default=None)
     p_next.add_argument("--tier", type=int, choices=[1, 2, 3, 4], default=None)
     p_next.add_argument("--count", type=int, default=5)
 
+
+def _add_resolve_parser(sub):
     # resolve: mark feature status
     p_resolve = sub.add_parser("resolve", help="Mark feature(s) as implemented/deferred/out_of_scope")
     p_resolve.add_argument("status", choices=["implemented", "deferred", "out_of_scope"])
     p_resolve.add_argument("patterns", nargs="+", help="Feature ID(s) or screen name patterns")
     p_resolve.add_argument("--state", type=str, default=None)
 
+
+def _add_match_parser(sub):
     # match: auto-detect implemented features from codebase
     p_match = sub.add_parser("match", help="Match features against codebase to auto-resolve implemented ones")
     p_match.add_argument("project_dir", type=str, help="Path to the project root")
@@ -68,6 +62,8 @@ examples:
     p_match.add_argument("--state", type=str, default=None)
     p_match.add_argument("--dry-run", action="store_true", help="Don't modify state, just show matches")
 
+
+def _add_plan_parser(sub):
     # plan: generate output artifacts
     p_plan = sub.add_parser("plan", help="Generate development artifacts from scan")
     p_plan.add_argument("--state", type=str, default=None)
@@ -76,6 +72,50 @@ examples:
                         help="Output format")
     p_plan.add_argument("--output", type=str, default=None, help="Output directory")
 
+
+# Subcommand name -> subparser builder, in help order
+_SUBPARSERS = {
+    "scan": _add_scan_parser,
+    "status": _add_status_parser,
+    "show": _add_show_parser,
+    "next": _add_next_parser,
+    "resolve": _add_resolve_parser,
+    "match": _add_match_parser,
+    "plan": _add_plan_parser,
+}
+
+
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    With a known ``command``, only that subparser is built, which is all
+    parse_args() needs to dispatch it. Otherwise every subcommand is added
+    so --help and error messages list them all.
+    """
+    parser = argparse.ArgumentParser(
+        prog="pen-audit",
+        description="pen-audit — design file feature scanner for .pen files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+examples:
+  pen-audit scan design-export.json
+  pen-audit scan design-export.json --format markdown
+  pen-audit status
+  pen-audit show screen
+  pen-audit show "Food Log"
+  pen-audit next
+  pen-audit resolve screen::abc123::FoodLog --status implemented
+  pen-audit plan --format all --output ./output/
+""",
+    )
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    if command in _SUBPARSERS:
+        _SUBPARSERS[command](sub)
+    else:
+        for add_parser in _SUBPARSERS.values():
+            add_parser(sub)
+
     return parser
 
 
@@ -84,6 +124,11 @@ def _get_state_path(args) -> Path | None:
     return Path(p) if p else None
 
 
+def _sorted_tiers(by_tier: dict) -> list[tuple]:
+    """Tier stats as (tier, stats) pairs in tier order (keys may be str after JSON load)."""
+    return sorted(by_tier.items(), key=lambda kv: int(kv[0]))
+
+
 def cmd_scan(args):
     """Run all detectors against a .pen export file."""
     from .pen_parser import load_pen_file
@@ -111,14 +156,14 @@ def cmd_scan(args):
 
     # Show results
     if args.format == "json":
-        print(json.dumps({
+        print(dump_json({
             "screens": len(doc.screens),
             "components": len(doc.components),
             "features": len(features),
             "diff": diff,
             "stats": state["stats"],
             "features_list": features,
-        }, indent=2))
+        }))
     elif args.format == "markdown":
         _print_markdown_summary(doc, features, state)
     else:
@@ -127,30 +172,32 @@ def cmd_scan(args):
 
 def _print_scan_summary(doc, features, state, diff):
     """Print the scan summary box."""
+    from .scoring import TIER_DESCRIPTIONS
+
     stats = state["stats"]
     by_tier = stats.get("by_tier", {})
 
-    # Count by detector
+    # Count by detector and collect unique component names in one pass
     by_detector: dict[str, int] = {}
+    component_names: set[str] = set()
     for f in features:
         det = f["detector"]
         by_detector[det] = by_detector.get(det, 0) + 1
+        if det == "component":
+            component_names.add(f["name"])
 
     lines = [
         "pen-audit scan results",
         "",
         f"Screens:     {len(doc.screens)}",
-        f"Components:  {len(doc.components)} ({len(set(c['name'] for c in features if c['detector'] == 'component'))} unique)",
+        f"Components:  {len(doc.components)} ({len(component_names)} unique)",
         f"Features:    {len(features)}",
         "",
     ]
 
-    for tier in sorted(by_tier.keys(), key=int):
-        tier_int = int(tier)
-        from .scoring import TIER_DESCRIPTIONS
-        label = TIER_DESCRIPTIONS.get(tier_int, f"Tier {tier}")
-        total = by_tier[tier]["total"]
-        done = by_tier[tier]["done"]
+    for tier, ts in _sorted_tiers(by_tier):
+        label = TIER_DESCRIPTIONS.get(int(tier), f"Tier {tier}")
+        total = ts["total"]
         lines.append(f"T{tier} ({label[:15]}): {total:3d} features")
 
     lines.append("")
@@ -166,49 +213,67 @@ def _print_scan_summary(doc, features, state, diff):
     print()
 
     # Per-detector breakdown
-    print(c("  Features by detector:", "bold"))
-    for det, count in sorted(by_detector.items()):
-        print(f"    {det:<15} {count:3d}")
-    print()
+    out = [c("  Features by detector:", "bold")]
+    out.extend(f"    {det:<15} {count:3d}" for det, count in sorted(by_detector.items()))
+    sys.stdout.write("\n".join(out) + "\n\n")
+
+
+_MARKDOWN_ICONS = {"open": "[ ]", "implemented": "[x]", "deferred": "[-]"}
+
+
+def _summary_group(f: dict) -> tuple[bool, str]:
+    """Grouping key for the markdown summary: (is_component, screen_name)."""
+    category = f["category"]
+    if category == "component":
+        return (True, "")
+    if category == "screen":
+        return (False, f["name"])
+    return (False, f["detail"].get("screen_name", "Unknown"))
 
 
 def _print_markdown_summary(doc, features, state):
     """Print a markdown feature inventory."""
-    print(f"# pen-audit: Feature Inventory\n")
-    print(f"**Source**: {doc.source_file}")
-    print(f"**Screens**: {len(doc.screens)}")
-    print(f"**Components**: {len(doc.components)}")
-    print(f"**Features detected**: {len(features)}\n")
-
-    # Group by screen
-    by_screen: dict[str, list[dict]] = {}
+    out = [
+        "# pen-audit: Feature Inventory\n",
+        f"**Source**: {doc.source_file}",
+        f"**Screens**: {len(doc.screens)}",
+        f"**Components**: {len(doc.components)}",
+        f"**Features detected**: {len(features)}\n",
+    ]
+
+    # Group by screen: one stable sort puts each screen's features together
+    # (in scan order) with components last, then groupby walks the runs.
+    keyed = sorted(((_summary_group(f), f) for f in features), key=itemgetter(0))
     non_screen = []
-    for f in features:
-        if f["category"] == "screen":
-            by_screen.setdefault(f["name"], []).append(f)
-        elif f["category"] == "component":
-            non_screen.append(f)
-        else:
-            screen_name = f["detail"].get("screen_name", "Unknown")
-            by_screen.setdefault(screen_name, []).append(f)
-
-    print("## Screens\n")
-    for screen_name, screen_features in sorted(by_screen.items()):
+
+    out.append("## Screens\n")
+    for (is_component, screen_name), group in groupby(keyed, key=itemgetter(0)):
+        if is_component:
+            non_screen = [f for _, f in group]
+            continue
+        screen_features = [f for _, f in group]
         screen_f = [f for f in screen_features if f["category"] == "screen"]
         tier = screen_f[0]["tier"] if screen_f else 2
         platform = screen_f[0]["detail"].get("platform", "unknown") if screen_f else "unknown"
-        print(f"### {screen_name} (T{tier}, {platform})\n")
+        out.append(f"### {screen_name} (T{tier}, {platform})\n")
         for f in screen_features:
-            status_icon = {"open": "[ ]", "implemented": "[x]", "deferred": "[-]"}.get(f["status"], "[ ]")
-            print(f"- {status_icon} {f['summary']}")
-        print()
+            out.append(f"- {_MARKDOWN_ICONS.get(f['status'], '[ ]')} {f['summary']}")
+        out.append("")
 
     if non_screen:
-        print("## Design System Components\n")
+        out.append("## Design System Components\n")
         for f in sorted(non_screen, key=lambda x: x["detail"].get("usage_count", 0), reverse=True):
             usage = f["detail"].get("usage_count", 0)
-            print(f"- **{f['name']}** — used {usage}x")
-        print()
+            out.append(f"- **{f['name']}** — used {usage}x")
+        out.append("")
+
+    # One write instead of a print() per line
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# Every possible progress bar, indexed by filled cell count
+_BAR30 = tuple("█" * i + "░" * (30 - i) for i in range(31))
+_BAR15 = tuple("█" * i + "░" * (15 - i) for i in range(16))
 
 
 def cmd_status(args):
@@ -225,16 +290,14 @@ def cmd_status(args):
     stats = state["stats"]
 
     if getattr(args, "json", False):
-        print(json.dumps(stats, indent=2))
+        print(dump_json(stats))
         return
 
     print(c("\npen-audit status\n", "bold"))
 
     # Overall progress bar
     pct = stats["pct"]
-    bar_len = 30
-    filled = round(pct / 100 * bar_len)
-    bar = "█" * filled + "░" * (bar_len - filled)
+    bar = _BAR30[round(pct / 100 * 30)]
     color = "green" if pct >= 80 else ("yellow" if pct >= 40 else "red")
     print(f"  Progress: {c(bar, color)} {pct}%")
     print(f"  {stats['implemented']}/{stats['total']} implemented"
@@ -246,15 +309,12 @@ def cmd_status(args):
     by_tier = stats.get("by_tier", {})
     from .scoring import TIER_NAMES
     rows = []
-    for tier in sorted(by_tier.keys(), key=int):
-        tier_int = int(tier)
-        ts = by_tier[tier]
+    for tier, ts in _sorted_tiers(by_tier):
         tier_pct = round(ts["done"] / ts["total"] * 100) if ts["total"] else 0
-        filled_t = round(tier_pct / 100 * 15)
-        bar_t = "█" * filled_t + "░" * (15 - filled_t)
+        bar_t = _BAR15[round(tier_pct / 100 * 15)]
         rows.append([
             f"T{tier}",
-            TIER_NAMES.get(tier_int, "?"),
+            TIER_NAMES.get(int(tier), "?"),
             bar_t,
             f"{tier_pct}%",
             f"{ts['done']}/{ts['total']}",
@@ -268,6 +328,20 @@ def cmd_status(args):
     print()
 
 
+_SEARCH_FIELDS = ("detector", "name", "screen_id", "id", "summary")
+
+_SHOW_ICONS = {"open": "○", "implemented": "●", "deferred": "◐", "out_of_scope": "◌"}
+
+
+def _search_text(f: dict) -> str:
+    """Searchable fields of a feature as one string.
+
+    Fields are NUL-joined so a pattern can never match across two fields
+    (argv strings cannot contain NUL).
+    """
+    return "\0".join(f.get(k, "") for k in _SEARCH_FIELDS)
+
+
 def cmd_show(args):
     """Show features, optionally filtered."""
     from .state import load_state
@@ -287,14 +361,9 @@ def cmd_show(args):
 
     # Filter by pattern
     if args.pattern:
-        pat = args.pattern.lower()
-        features = [f for f in features if (
-            pat in f.get("detector", "").lower() or
-            pat in f.get("name", "").lower() or
-            pat in f.get("screen_id", "").lower() or
-            pat in f.get("id", "").lower() or
-            pat in f.get("summary", "").lower()
-        )]
+        # One case-insensitive scan per feature instead of lowercasing it
+        search = re.compile(re.escape(args.pattern), re.IGNORECASE).search
+        features = [f for f in features if search(_search_text(f))]
 
     if not features:
         print(c(f"  No features found matching '{args.pattern or 'all'}'", "yellow"))
@@ -302,15 +371,17 @@ def cmd_show(args):
 
     print(c(f"\n  {len(features)} features:\n", "bold"))
 
-    rows = []
-    for f in sorted(features, key=lambda x: (x["tier"], x["detector"])):
-        status_icon = {"open": "○", "implemented": "●", "deferred": "◐", "out_of_scope": "◌"}.get(f["status"], "?")
-        rows.append([
-            f"T{f['tier']}",
-            status_icon,
-            f["detector"][:12],
-            f["summary"][:60],
-        ])
+    # Pull the displayed fields into plain tuples once. The index breaks
+    # (tier, detector) ties in scan order, like the previous stable sort.
+    records = sorted(
+        (f["tier"], f["detector"], i, f["status"], f["summary"])
+        for i, f in enumerate(features)
+    )
+    icon = _SHOW_ICONS.get
+    rows = [
+        [f"T{tier}", icon(status, "?"), detector[:12], summary[:60]]
+        for tier, detector, _, status, summary in records
+    ]
 
     print_table(
         ["Tier", "St", "Detector", "Summary"],
@@ -338,28 +409,26 @@ def cmd_next(args):
         return
 
     # Sort by tier (lower first = easier wins), then by detector
-    open_features.sort(key=lambda f: (f["tier"], f["detector"], f["name"]))
+    open_features.sort(key=itemgetter("tier", "detector", "name"))
 
     count = min(args.count, len(open_features))
     print(c(f"\n  Next {count} features to implement:\n", "bold"))
 
     for i, f in enumerate(open_features[:count], 1):
-        print(f"  {i}. [{c(f'T{f["tier"]}', 'cyan')}] {f['summary']}")
+        tier_tag = c(f"T{f['tier']}", "cyan")
+        print(f"  {i}. [{tier_tag}] {f['summary']}")
         print(c(f"     ID: {f['id']}", "dim"))
     print()
 
 
 def cmd_resolve(args):
     """Mark features as implemented/deferred/out_of_scope."""
-    from .state import load_state, save_state, resolve_feature
+    from .state import load_state, save_state, resolve_features
 
     sp = _get_state_path(args)
     state = load_state(sp)
 
-    total_resolved = []
-    for pattern in args.patterns:
-        resolved = resolve_feature(state, pattern, args.status)
-        total_resolved.extend(resolved)
+    total_resolved = resolve_features(state, args.patterns, args.status)
 
     if total_resolved:
         save_state(state, sp)
@@ -419,8 +488,93 @@ def cmd_match(args):
     print()
 
 
+def _write_files(base_dir: Path, files: list[dict]):
+    """Write generated {"path", "content"} files under base_dir in parallel.
+
+    Screens can slugify to the same path; the last entry for a path wins, as
+    with sequential writes, and each file is written by exactly one thread.
+    """
+    targets = {base_dir / f["path"]: f["content"] for f in files}
+    for parent in {path.parent for path in targets}:
+        parent.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda t: t[0].write_text(t[1]), targets.items()))
+
+
+# Each plan emitter prints its artifact when output_dir is None, otherwise
+# writes it and returns the status line to print. ``screens`` is the shared
+# build_screen_index() grouping (None when no selected emitter needs it).
+
+def _plan_markdown(state: dict, output_dir: Path | None, screens: dict | None) -> str | None:
+    from .formatters.markdown import generate_markdown
+    md = generate_markdown(state)
+    if not output_dir:
+        print(md)
+        return None
+    (output_dir / "feature-inventory.md").write_text(md)
+    return c(f"  Written: {output_dir / 'feature-inventory.md'}", "green")
+
+
+def _plan_routes(state: dict, output_dir: Path | None, screens: dict | None) -> str | None:
+    from .formatters.routes import generate_routes
+    routes = generate_routes(state)
+    if not output_dir:
+        print(dump_json(routes))
+        return None
+    (output_dir / "routes.json").write_bytes(dump_json_bytes(routes))
+    return c(f"  Written: {output_dir / 'routes.json'}", "green")
+
+
+def _plan_jira(state: dict, output_dir: Path | None, screens: dict | None) -> str | None:
+    from .formatters.jira import generate_jira_tasks
+    tasks = generate_jira_tasks(state, screens)
+    if not output_dir:
+        print(dump_json(tasks, default=str))
+        return None
+    (output_dir / "jira-tasks.json").write_bytes(dump_json_bytes(tasks, default=str))
+    return c(f"  Written: {output_dir / 'jira-tasks.json'} ({len(tasks)} tasks)", "green")
+
+
+def _plan_stubs(state: dict, output_dir: Path | None, screens: dict | None) -> str | None:
+    from .formatters.stubs import generate_stubs
+    stubs = generate_stubs(state, screens=screens)
+    if not output_dir:
+        for stub in stubs:
+            print(c(f"\n--- {stub['path']} ---", "cyan"))
+            print(stub["content"])
+        return None
+    stubs_dir = output_dir / "stubs"
+    stubs_dir.mkdir(parents=True, exist_ok=True)
+    _write_files(stubs_dir, stubs)
+    return c(f"  Written: {len(stubs)} page stubs to {stubs_dir}/", "green")
+
+
+def _plan_tests(state: dict, output_dir: Path | None, screens: dict | None) -> str | None:
+    from .formatters.tests import generate_test_skeletons
+    test_files = generate_test_skeletons(state, screens)
+    if not output_dir:
+        for tf in test_files:
+            print(c(f"\n--- {tf['path']} ---", "cyan"))
+            print(tf["content"])
+        return None
+    tests_dir = output_dir / "tests"
+    tests_dir.mkdir(parents=True, exist_ok=True)
+    _write_files(tests_dir, test_files)
+    return c(f"  Written: {len(test_files)} test skeletons to {tests_dir}/", "green")
+
+
+_PLAN_FORMATS = {
+    "markdown": _plan_markdown,
+    "routes": _plan_routes,
+    "jira": _plan_jira,
+    "stubs": _plan_stubs,
+    "tests": _plan_tests,
+}
+
+
 def cmd_plan(args):
     """Generate development artifacts."""
+    from .formatters._index import build_screen_index
     from .state import load_state
 
     sp = _get_state_path(args)
@@ -432,77 +586,37 @@ def cmd_plan(args):
 
     fmt = args.format
     output_dir = Path(args.output) if args.output else None
-
-    if fmt in ("markdown", "all"):
-        from .formatters.markdown import generate_markdown
-        md = generate_markdown(state)
-        if output_dir:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            (output_dir / "feature-inventory.md").write_text(md)
-            print(c(f"  Written: {output_dir / 'feature-inventory.md'}", "green"))
-        else:
-            print(md)
-
-    if fmt in ("routes", "all"):
-        from .formatters.routes import generate_routes
-        routes = generate_routes(state)
-        if output_dir:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            (output_dir / "routes.json").write_text(json.dumps(routes, indent=2))
-            print(c(f"  Written: {output_dir / 'routes.json'}", "green"))
-        else:
-            print(json.dumps(routes, indent=2))
-
-    if fmt in ("jira", "all"):
-        from .formatters.jira import generate_jira_tasks
-        tasks = generate_jira_tasks(state)
-        if output_dir:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            (output_dir / "jira-tasks.json").write_text(json.dumps(tasks, indent=2, default=str))
-            print(c(f"  Written: {output_dir / 'jira-tasks.json'} ({len(tasks)} tasks)", "green"))
-        else:
-            print(json.dumps(tasks, indent=2, default=str))
-
-    if fmt in ("stubs", "all"):
-        from .formatters.stubs import generate_stubs
-        stubs = generate_stubs(state)
-        if output_dir:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            stubs_dir = output_dir / "stubs"
-            stubs_dir.mkdir(parents=True, exist_ok=True)
-            for stub in stubs:
-                stub_path = stubs_dir / stub["path"]
-                stub_path.parent.mkdir(parents=True, exist_ok=True)
-                stub_path.write_text(stub["content"])
-            print(c(f"  Written: {len(stubs)} page stubs to {stubs_dir}/", "green"))
-        else:
-            for stub in stubs:
-                print(c(f"\n--- {stub['path']} ---", "cyan"))
-                print(stub["content"])
-
-    if fmt in ("tests", "all"):
-        from .formatters.tests import generate_test_skeletons
-        test_files = generate_test_skeletons(state)
-        if output_dir:
-            output_dir.mkdir(parents=True, exist_ok=True)
-            tests_dir = output_dir / "tests"
-            tests_dir.mkdir(parents=True, exist_ok=True)
-            for tf in test_files:
-                test_path = tests_dir / tf["path"]
-                test_path.parent.mkdir(parents=True, exist_ok=True)
-                test_path.write_text(tf["content"])
-            print(c(f"  Written: {len(test_files)} test skeletons to {tests_dir}/", "green"))
-        else:
-            for tf in test_files:
-                print(c(f"\n--- {tf['path']} ---", "cyan"))
-                print(tf["content"])
+    emitters = [emit for name, emit in _PLAN_FORMATS.items() if fmt in (name, "all")]
+    # Jira, stubs and tests all group features by screen; build that once
+    screens = build_screen_index(state) if fmt in ("jira", "stubs", "tests", "all") else None
+
+    if output_dir:
+        # Artifacts are independent: generate and write them concurrently,
+        # then report in the usual order. A failing emitter doesn't hide what
+        # the others wrote; its error is raised after their status lines.
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=len(emitters)) as pool:
+            futures = [pool.submit(emit, state, output_dir, screens) for emit in emitters]
+        error = None
+        for future in futures:
+            if future.exception() is None:
+                print(future.result())
+            elif error is None:
+                error = future.exception()
+        if error is not None:
+            raise error
+    else:
+        for emit in emitters:
+            emit(state, None, screens)
 
     print()
 
 
 def main():
-    parser = create_parser()
-    args = parser.parse_args()
+    # Peek at the subcommand so only its subparser gets built
+    argv = sys.argv[1:]
+    parser = create_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
 
     commands = {
         "scan": cmd_scan,
@@ -7,32 +7,56 @@ and component implementations to auto-resolve features.
 from __future__ import annotations
 
 import json
+import os
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 
+_RE_NON_SLUG = re.compile(r'[^a-z0-9\s-]')
+_RE_SEPARATORS = re.compile(r'[\s_]+')
+_RE_DASHES = re.compile(r'-+')
+_RE_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+
+@lru_cache(maxsize=None)
 def _slugify(name: str) -> str:
     slug = name.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug).strip('-')
+    slug = _RE_NON_SLUG.sub('', slug)
+    slug = _RE_SEPARATORS.sub('-', slug)
+    slug = _RE_DASHES.sub('-', slug).strip('-')
     return slug
 
 
+@lru_cache(maxsize=None)
 def _normalize(s: str) -> str:
     """Normalize a string for fuzzy comparison."""
-    return re.sub(r'[^a-z0-9]', '', s.lower())
+    return _RE_NON_ALNUM.sub('', s.lower())
 
 
 def _find_page_files(app_dir: Path) -> dict[str, Path]:
     """Find all page.tsx files and map route paths to file paths."""
     pages: dict[str, Path] = {}
-    for page_file in app_dir.rglob("page.tsx"):
-        rel = page_file.parent.relative_to(app_dir)
-        parts = [p for p in rel.parts if not p.startswith("(") and not p.startswith("[")]
-        slug = "/".join(parts)
-        if slug:
-            pages[slug] = page_file
+
+    def walk(dir_path: str, parts: list[str]) -> None:
+        # Pre-order like rglob: a directory's own page before its subdirectories
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry)
+                    elif entry.name == "page.tsx" and parts:
+                        pages["/".join(parts)] = Path(entry.path)
+        except OSError:
+            return
+        for entry in subdirs:
+            # Route groups "(name)" and dynamic segments "[id]" are not part of the slug
+            name = entry.name
+            walk(entry.path, parts if name.startswith(("(", "[")) else parts + [name])
+
+    walk(str(app_dir), [])
     return pages
 
 
@@ -43,33 +67,52 @@ def _find_routes_json(project_dir: Path) -> list[dict]:
         project_dir / "routes.json",
     ]
     for p in candidates:
-        if p.exists():
-            try:
-                data = json.loads(p.read_text())
-                routes = data.get("routes", []) if isinstance(data, dict) else data
-                if isinstance(routes, list):
-                    return routes
-            except (json.JSONDecodeError, OSError):
-                pass
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        routes = _load_routes(str(p), st.st_mtime_ns, st.st_size)
+        if routes is not None:
+            return routes
     return []
 
 
+@lru_cache(maxsize=8)
+def _load_routes(path: str, mtime_ns: int, size: int) -> list[dict] | None:
+    """Parse a routes file. Keyed on mtime/size so an unchanged file is parsed once."""
+    try:
+        data = json.loads(Path(path).read_text())
+    except (json.JSONDecodeError, OSError):
+        return None
+    routes = data.get("routes", []) if isinstance(data, dict) else data
+    return routes if isinstance(routes, list) else None
+
+
 def _is_stub_page(page_path: Path) -> bool:
     """Check if a page file is just a stub (Coming Soon) or has real content."""
+    # The verdict only depends on the first 30 lines of content, so stop
+    # reading there instead of loading the whole file.
+    line_count = 0  # lines from the first to the last non-blank line seen
+    pending = 0  # lines read since the first non-blank line
+    coming_soon = False
     try:
-        content = page_path.read_text(errors="replace")
+        with page_path.open(errors="replace") as fh:
+            for line in fh:
+                if line.strip():
+                    pending += 1
+                    line_count = pending
+                    if line_count >= 30:
+                        return False
+                elif line_count:
+                    pending += 1
+                if not coming_soon and "coming soon" in line.lower():
+                    coming_soon = True
     except OSError:
         return True
 
-    lines = content.strip().splitlines()
-    if len(lines) < 10:
-        return True
-
-    content_lower = content.lower()
-    if "coming soon" in content_lower and len(lines) < 30:
+    if line_count < 10:
         return True
-
-    return False
+    return coming_soon
 
 
 def _build_route_map(routes: list[dict]) -> dict[str, dict]:
@@ -84,6 +127,73 @@ def _build_route_map(routes: list[dict]) -> dict[str, dict]:
     return result
 
 
+@dataclass
+class _PageIndex:
+    """Lookup tables over the discovered page files.
+
+    Each table maps a key to the first page slug in discovery order, which is
+    what the original first-hit linear scans over ``pages`` picked.
+    """
+    pages: dict[str, Path]
+    order: dict[str, int] = field(default_factory=dict)
+    by_slug: dict[str, str] = field(default_factory=dict)
+    by_last_segment: dict[str, str] = field(default_factory=dict)
+    by_norm: dict[str, str] = field(default_factory=dict)
+    by_suffix: dict[str, str] = field(default_factory=dict)  # suffixes of the last segment
+
+    def __post_init__(self) -> None:
+        for i, page_slug in enumerate(self.pages):
+            self.order[page_slug] = i
+            self.by_slug.setdefault(page_slug[4:] if page_slug.startswith("app/") else page_slug, page_slug)
+            self.by_last_segment.setdefault(page_slug.rsplit("/", 1)[-1], page_slug)
+            self.by_norm.setdefault(_normalize(page_slug), page_slug)
+            # for_route looks up a single path segment, so only suffixes that
+            # lie within the slug's last segment can ever be hit
+            last_start = page_slug.rfind("/") + 1
+            for j in range(last_start, len(page_slug) + 1):
+                self.by_suffix.setdefault(page_slug[j:], page_slug)
+
+    def for_route(self, rpath: str) -> str | None:
+        """First page whose slug is a suffix of rpath, or ends with rpath's last segment."""
+        candidates = [rpath[i:] for i in range(len(rpath)) if rpath[i:] in self.pages]
+        by_last = self.by_suffix.get(rpath.rsplit("/", 1)[-1])
+        if by_last:
+            candidates.append(by_last)
+        return min(candidates, key=self.order.__getitem__) if candidates else None
+
+
+def _match_feature(
+    slug: str,
+    norm_name: str,
+    route_map: dict[str, dict],
+    index: _PageIndex,
+) -> tuple[Path | None, str | None]:
+    """Find the page file for a screen. Returns (page_path, matched_via), first strategy wins."""
+    # Strategy 1: Match via routes.json screen_name
+    route_data = route_map.get(norm_name)
+    if route_data is not None:
+        page_slug = index.for_route(route_data.get("path", "").lstrip("/"))
+        if page_slug:
+            return index.pages[page_slug], "routes.json"
+
+    # Strategy 2: Exact slug match in page files
+    page_slug = index.by_slug.get(slug)
+    if page_slug:
+        return index.pages[page_slug], "exact_slug"
+
+    # Strategy 3: Last segment match
+    page_slug = index.by_last_segment.get(slug)
+    if page_slug:
+        return index.pages[page_slug], "last_segment"
+
+    # Strategy 4: Normalized name match against page paths
+    page_slug = index.by_norm.get(norm_name)
+    if page_slug:
+        return index.pages[page_slug], "normalized"
+
+    return None, None
+
+
 def match_codebase(
     state: dict,
     project_dir: str | Path,
@@ -114,20 +224,11 @@ def match_codebase(
 
     # Find page files and routes
     pages = _find_page_files(app_dir)
+
+    index = _PageIndex(pages)
     routes = _find_routes_json(project)
     route_map = _build_route_map(routes)
 
-    # Also build a reverse map: route path -> page path
-    route_path_to_page: dict[str, Path] = {}
-    for route in routes:
-        if not isinstance(route, dict):
-            continue
-        rpath = route.get("path", "").lstrip("/")
-        for page_slug, page_path in pages.items():
-            if rpath == page_slug or rpath.lstrip("app/") == page_slug.lstrip("app/"):
-                route_path_to_page[rpath] = page_path
-                break
-
     results = {
         "matched": [],
         "stub": [],
@@ -137,56 +238,16 @@ def match_codebase(
         "total_missing": 0,
     }
 
+    # Only open screens are matched; derive their lookup keys in one pass.
     features = state.get("features", {})
-    for fid, f in features.items():
-        if f["category"] != "screen":
-            continue
-        if f["status"] != "open":
-            continue
+    feature_keys = [
+        (fid, f, f["name"], _slugify(f["name"]), _normalize(f["name"]))
+        for fid, f in features.items()
+        if f["category"] == "screen" and f["status"] == "open"
+    ]
 
-        name = f["name"]
-        slug = _slugify(name)
-        norm_name = _normalize(name)
-
-        page_path = None
-        matched_via = None
-
-        # Strategy 1: Match via routes.json screen_name
-        if norm_name in route_map:
-            route_data = route_map[norm_name]
-            rpath = route_data.get("path", "").lstrip("/")
-            matched_via = "routes.json"
-            # Find the corresponding page file
-            for page_slug, path in pages.items():
-                if rpath == page_slug or rpath.endswith(page_slug) or page_slug.endswith(rpath.split("/")[-1]):
-                    page_path = path
-                    break
-
-        # Strategy 2: Exact slug match in page files
-        if not page_path:
-            for page_slug, path in pages.items():
-                if slug == page_slug or f"app/{slug}" == page_slug:
-                    page_path = path
-                    matched_via = "exact_slug"
-                    break
-
-        # Strategy 3: Last segment match
-        if not page_path:
-            for page_slug, path in pages.items():
-                segments = page_slug.split("/")
-                if segments and segments[-1] == slug:
-                    page_path = path
-                    matched_via = "last_segment"
-                    break
-
-        # Strategy 4: Normalized name match against page paths
-        if not page_path:
-            for page_slug, path in pages.items():
-                norm_page = _normalize(page_slug)
-                if norm_name == norm_page:
-                    page_path = path
-                    matched_via = "normalized"
-                    break
+    for fid, f, name, slug, norm_name in feature_keys:
+        page_path, matched_via = _match_feature(slug, norm_name, route_map, index)
 
         # Check routes.json for route entry
         has_route = norm_name in route_map
@@ -1,5 +1,7 @@
 """UI pattern detectors for .pen files."""
 
+from .base import PatternDetector, run_pattern_detectors
+
 from .screen import ScreenDetector
 from .component import ComponentDetector
 from .navigation import NavigationDetector
@@ -20,9 +22,16 @@ ALL_DETECTORS = [
 
 
 def run_all_detectors(doc) -> list[dict]:
-    """Run all detectors against a PenDocument and return combined features."""
+    """Run all detectors against a PenDocument and return combined features.
+
+    Name-pattern detectors share one walk per screen; the rest run on their own.
+    Features are returned grouped by detector in ``ALL_DETECTORS`` order.
+    """
+    detectors = [detector_cls() for detector_cls in ALL_DETECTORS]
+    pattern_detectors = [d for d in detectors if isinstance(d, PatternDetector)]
+    walked = dict(zip(pattern_detectors, run_pattern_detectors(doc, pattern_detectors)))
+
     features = []
-    for detector_cls in ALL_DETECTORS:
-        detector = detector_cls()
-        features.extend(detector.detect(doc))
+    for detector in detectors:
+        features.extend(walked[detector] if detector in walked else detector.detect(doc))
     return features
@@ -0,0 +1,62 @@
+"""Shared keyword matcher for the name-based pattern detectors."""
+
+from __future__ import annotations
+import re
+from typing import Iterable
+
+
+class KeywordMatcher:
+    """Classifies node names against many keyword families in one regex scan.
+
+    Families are ``(owner, family, keywords)`` triples; ``owner`` is the
+    detector name. A family hits when any of its keywords is a substring of
+    the node's ``normalized_name``, exactly like ``any(k in key for k in keywords)``.
+    """
+
+    def __init__(self, families: Iterable[tuple[str, str, Iterable[str]]]):
+        self._order: list[tuple[str, str]] = []
+        owners: dict[str, int] = {}  # keyword -> bitmask of family indexes
+        for idx, (owner, family, keywords) in enumerate(families):
+            self._order.append((owner, family))
+            for kw in keywords:
+                owners[kw] = owners.get(kw, 0) | (1 << idx)
+
+        # The lookahead reports only the longest keyword starting at each
+        # position, so credit it with every keyword that is a prefix of it.
+        self._hits: dict[str, int] = {}
+        for kw in owners:
+            mask = 0
+            for other, bits in owners.items():
+                if kw.startswith(other):
+                    mask |= bits
+            self._hits[kw] = mask
+        alternation = "|".join(map(re.escape, sorted(owners, key=len, reverse=True)))
+        self._re = re.compile(f"(?=({alternation}))")
+        self._cache: dict[str, tuple[tuple[str, tuple[str, ...]], ...]] = {}
+        self._decoded: dict[int, tuple[tuple[str, tuple[str, ...]], ...]] = {}
+
+    def mask(self, key: str) -> int:
+        """Bitmask of the family indexes hit by a normalized name."""
+        hits = self._hits
+        mask = 0
+        for m in self._re.finditer(key):
+            mask |= hits[m.group(1)]
+        return mask
+
+    def classify(self, key: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+        """Return ``(owner, families)`` pairs hit by a normalized name, in declaration order."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        mask = self.mask(key)
+        result = self._decoded.get(mask)
+        if result is None:
+            grouped: dict[str, list[str]] = {}
+            for idx, (owner, family) in enumerate(self._order):
+                if mask >> idx & 1:
+                    grouped.setdefault(owner, []).append(family)
+            result = tuple((owner, tuple(fams)) for owner, fams in grouped.items())
+            self._decoded[mask] = result
+        self._cache[key] = result
+        return result
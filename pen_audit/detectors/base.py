@@ -1,9 +1,17 @@
 """Base class for .pen file UI pattern detectors."""
 
 from __future__ import annotations
+import re
 from abc import ABC, abstractmethod
+from typing import Any, Iterable, Iterator
 
-from ..pen_parser import PenDocument
+from ._patterns import KeywordMatcher
+from ..pen_parser import PenDocument, PenNode
+
+
+def keyword_regex(keywords: Iterable[str]) -> re.Pattern[str]:
+    """Compile keywords into one alternation; ``.search()`` hits if any is a substring."""
+    return re.compile("|".join(map(re.escape, keywords)))
 
 
 class BaseDetector(ABC):
@@ -20,3 +28,65 @@ class BaseDetector(ABC):
     def detect(self, doc: PenDocument) -> list[dict]:
         """Run detection against the document. Returns list of feature dicts."""
         ...
+
+
+class PatternDetector(BaseDetector):
+    """Detector driven by keyword families matched against node names.
+
+    Subclasses declare ``families`` (family -> keywords) and collect hits per
+    screen through ``begin_screen``/``accumulate``/``finalize``, so several
+    detectors can share one walk of each screen (see ``detect_screen``).
+    Per-screen state lives in the accumulator, not on the detector, so one
+    instance can process screens independently.
+    """
+
+    families: dict[str, list[str]] = {}
+
+    @abstractmethod
+    def begin_screen(self, screen: PenNode) -> Any:
+        """Return a fresh accumulator for a screen about to be walked."""
+        ...
+
+    @abstractmethod
+    def accumulate(self, acc: Any, families: tuple[str, ...], node: PenNode) -> None:
+        """Record a named node that hit ``families`` (in declaration order)."""
+        ...
+
+    @abstractmethod
+    def finalize(self, screen: PenNode, acc: Any) -> Iterator[dict]:
+        """Yield the feature dicts for a walked screen."""
+        ...
+
+    def detect(self, doc: PenDocument) -> list[dict]:
+        return run_pattern_detectors(doc, [self])[0]
+
+
+def keyword_matcher(detectors: list[PatternDetector]) -> KeywordMatcher:
+    """Build one matcher over the keyword families of all given detectors."""
+    return KeywordMatcher(
+        (d.name, family, keywords) for d in detectors for family, keywords in d.families.items()
+    )
+
+
+def detect_screen(
+    screen: PenNode, detectors: list[PatternDetector], matcher: KeywordMatcher,
+) -> list[Iterator[dict]]:
+    """Feed every detector from a single walk of one screen. Returns features per detector."""
+    slots = {d.name: (d, d.begin_screen(screen)) for d in detectors}
+    named_nodes = [(node, node.normalized_name) for node in screen.walk() if node.name]
+    classify = matcher.classify
+    for node, name_lower in named_nodes:
+        for owner, families in classify(name_lower):
+            detector, acc = slots[owner]
+            detector.accumulate(acc, families, node)
+    return [detector.finalize(screen, acc) for detector, acc in slots.values()]
+
+
+def run_pattern_detectors(doc: PenDocument, detectors: list[PatternDetector]) -> list[list[dict]]:
+    """Run ``detect_screen`` over every screen. Returns features per detector."""
+    matcher = keyword_matcher(detectors)
+    results: list[list[dict]] = [[] for _ in detectors]
+    for screen in doc.screens:
+        for features, screen_features in zip(results, detect_screen(screen, detectors, matcher)):
+            features.extend(screen_features)
+    return results
@@ -23,22 +23,23 @@ class ComponentDetector(BaseDetector):
 
         # Find all instances (ref nodes) and count usage
         usage_counter: Counter[str] = Counter()
-        instance_locations: dict[str, list[str]] = {}  # ref_id -> [screen_names]
+        # ref_id -> {screen_name: None}; a dict keeps first-seen order with O(1) dedup
+        instance_locations: dict[str, dict[str, None]] = {}
 
         for screen in doc.screens:
-            for node in screen.walk():
-                if node.type == "ref":
-                    ref_id = node.properties.get("ref", "")
-                    if ref_id:
-                        usage_counter[ref_id] += 1
-                        locs = instance_locations.setdefault(ref_id, [])
-                        if screen.name and screen.name not in locs:
-                            locs.append(screen.name)
+            ref_ids = [
+                ref_id for node in screen.walk()
+                if node.type == "ref" and (ref_id := node.properties.get("ref", ""))
+            ]
+            usage_counter.update(ref_ids)
+            if screen.name:
+                for ref_id in ref_ids:
+                    instance_locations.setdefault(ref_id, {})[screen.name] = None
 
         # Report each component with usage stats
         for comp in components:
             usage = usage_counter.get(comp.id, 0)
-            screens_used = instance_locations.get(comp.id, [])
+            screens_used = list(instance_locations.get(comp.id, ()))
 
             features.append(make_feature(
                 detector="component",
@@ -1,8 +1,12 @@
 """Screen detector: identifies top-level frames as screens."""
 
 from __future__ import annotations
+import re
+from collections import Counter
+from functools import lru_cache
 
-from .base import BaseDetector
+from ._patterns import KeywordMatcher
+from .base import BaseDetector, keyword_regex
 from ..pen_parser import PenDocument, PenNode
 from ..state import make_feature
 from ..scoring import classify_screen_tier
@@ -19,24 +23,109 @@ _MOBILE_WIDTHS = range(320, 430)
 _TABLET_WIDTHS = range(700, 850)
 _DESKTOP_WIDTHS = range(1200, 1600)
 
+_CRUD_KEYWORDS = ["add", "create", "new", "edit", "delete", "remove"]
+
+# Descendant-name keywords counted by _count_features, as (counter keys, keywords).
+# Listed in counting order so feature_counts keys keep their first-seen order.
+_FEATURE_KEYWORDS: list[tuple[tuple[str, ...], list[str]]] = [
+    (("forms",), ["input", "field", "text_field", "textfield", "search", "form"]),
+    (("lists",), ["list", "row", "item", "cell"]),
+    (("cards",), ["card"]),
+    (("charts",), ["chart", "graph", "ring", "progress", "donut"]),
+    (("tabs",), ["tab", "segment"]),
+    (("modals",), ["modal", "sheet", "dialog", "overlay", "popup"]),
+    (("camera", "scanner"), ["camera", "scanner", "barcode", "qr"]),
+    (("timers",), ["timer", "stopwatch", "countdown"]),
+    (("map",), ["map"]),
+    (("crud",), _CRUD_KEYWORDS),
+    (("drag_drop",), ["drag", "reorder", "sortable"]),
+    (("builders",), ["builder"]),
+]
+
+# Keywords only match whole words, optionally plural: "map" hits "MapView" and
+# "Maps" but not "Heatmap" or "Mapping". _word_key wraps every word in "_", so
+# "_" + keyword + "_" (or the "s" plural) as a substring is a whole-word hit.
+_RE_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])|(?<=[A-Za-z])(?=[0-9])")
+_RE_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _word_key(text: str) -> str:
+    """Lowercase text split into "_"-delimited words, camelCase and digits included."""
+    return "_" + _RE_NON_ALNUM.sub("_", _RE_CAMEL_BOUNDARY.sub("_", text).lower()) + "_"
+
+
+def _word_patterns(keywords: list[str]) -> list[str]:
+    """Substrings of a _word_key that hit each keyword as a whole word or plural."""
+    return [f"_{kw}{plural}_" for kw in keywords for plural in ("", "s")]
+
+
+_FEATURE_MATCHER = KeywordMatcher(
+    ("screen", keys[0], _word_patterns(keywords)) for keys, keywords in _FEATURE_KEYWORDS
+)
+_CRUD_BIT = 1 << [keys for keys, _ in _FEATURE_KEYWORDS].index(("crud",))
+# CRUD also counts a frame's text content, e.g. an "Add meal" label
+_CRUD_TEXT_RE = keyword_regex(_word_patterns(_CRUD_KEYWORDS))
+
 
 def _detect_platform(node: PenNode) -> str:
     """Detect target platform from frame dimensions."""
     w = node.properties.get("width", 0)
     if isinstance(w, (int, float)):
-        if w in _MOBILE_WIDTHS or (360 <= w <= 414):
+        # Range membership is O(1) for ints but a linear scan for floats, and only
+        # whole numbers can be members, so test floats as ints (-1 if fractional).
+        whole = w if isinstance(w, int) else int(w) if w.is_integer() else -1
+        if whole in _MOBILE_WIDTHS or (360 <= w <= 414):
             return "mobile"
-        if w in _TABLET_WIDTHS or (768 <= w <= 834):
+        if whole in _TABLET_WIDTHS or (768 <= w <= 834):
             return "tablet"
         if w >= 1200:
             return "desktop"
     return "unknown"
 
 
-def _count_features(node: PenNode) -> dict[str, int]:
+def _is_screen_frame(node: PenNode) -> bool:
+    """Non-reusable top-level frames, minus design system containers."""
+    # Cheap type/reusable checks first; the name is only lowercased for survivors
+    return node.is_screen and not (node.name and node.name.lower() in _SYSTEM_NAMES)
+
+
+def _scan_subtree(node: PenNode) -> tuple[dict[str, int], list[str], int, int]:
+    """Walk a subtree once, returning (type counts, text content, node count, max depth).
+
+    Pre-order like PenNode.walk(), so counts and texts come out in the same order
+    as count_by_type() and find_text_content().
+    """
+    type_counts: dict[str, int] = {}
+    texts: list[str] = []
+    node_count = 0
+    max_depth = 0
+    stack = [(node, 0)]
+    while stack:
+        n, depth = stack.pop()
+        node_count += 1
+        if depth > max_depth:
+            max_depth = depth
+        type_counts[n.type] = type_counts.get(n.type, 0) + 1
+        if n.type == "text":
+            content = n.properties.get("content", "")
+            if content:
+                texts.append(content)
+        if n.children:
+            stack.extend((child, depth + 1) for child in reversed(n.children))
+    return type_counts, texts, node_count, max_depth
+
+
+@lru_cache(maxsize=None)
+def _mask_keys(mask: int) -> tuple[str, ...]:
+    """Counter keys bumped by a feature bitmask, in counting order."""
+    return tuple(key for i, (keys, _) in enumerate(_FEATURE_KEYWORDS) if mask >> i & 1 for key in keys)
+
+
+def _count_features(node: PenNode, type_counts: dict[str, int] | None = None) -> dict[str, int]:
     """Count feature types in a screen's subtree for tier classification."""
-    counts: dict[str, int] = {}
-    type_counts = node.count_by_type()
+    counts: Counter[str] = Counter()
+    if type_counts is None:
+        type_counts = node.count_by_type()
 
     # Text nodes suggest static content
     counts["text_nodes"] = type_counts.get("text", 0)
@@ -44,62 +133,36 @@ def _count_features(node: PenNode) -> dict[str, int]:
     # Ref nodes suggest component usage
     counts["ref_nodes"] = type_counts.get("ref", 0)
 
-    # Look for specific patterns in descendant names and content
-    for n in node.walk():
-        name_lower = n.name.lower() if n.name else ""
-        texts = " ".join(n.find_text_content()).lower() if n.type == "frame" else ""
-        combined = name_lower + " " + texts
-
-        # Forms
-        if any(k in name_lower for k in ["input", "field", "text_field", "search", "form"]):
-            counts["forms"] = counts.get("forms", 0) + 1
-
-        # Lists
-        if any(k in name_lower for k in ["list", "row", "item", "cell"]):
-            counts["lists"] = counts.get("lists", 0) + 1
-
-        # Cards
-        if "card" in name_lower:
-            counts["cards"] = counts.get("cards", 0) + 1
-
-        # Charts/visualizations
-        if any(k in name_lower for k in ["chart", "graph", "ring", "progress", "donut"]):
-            counts["charts"] = counts.get("charts", 0) + 1
-
-        # Tabs
-        if any(k in name_lower for k in ["tab", "segment"]):
-            counts["tabs"] = counts.get("tabs", 0) + 1
-
-        # Modals/sheets
-        if any(k in name_lower for k in ["modal", "sheet", "dialog", "overlay", "popup"]):
-            counts["modals"] = counts.get("modals", 0) + 1
-
-        # Camera/scanner
-        if any(k in name_lower for k in ["camera", "scanner", "barcode", "qr"]):
-            counts["camera"] = counts.get("camera", 0) + 1
-            counts["scanner"] = counts.get("scanner", 0) + 1
-
-        # Timer/stopwatch
-        if any(k in name_lower for k in ["timer", "stopwatch", "countdown"]):
-            counts["timers"] = counts.get("timers", 0) + 1
-
-        # Map
-        if "map" in name_lower:
-            counts["map"] = counts.get("map", 0) + 1
-
-        # CRUD buttons
-        if any(k in combined for k in ["add", "create", "new", "edit", "delete", "remove"]):
-            counts["crud"] = counts.get("crud", 0) + 1
-
-        # Drag/reorder
-        if any(k in name_lower for k in ["drag", "reorder", "sortable"]):
-            counts["drag_drop"] = counts.get("drag_drop", 0) + 1
-
-        # Builder pattern
-        if "builder" in name_lower:
-            counts["builders"] = counts.get("builders", 0) + 1
-
-    return counts
+    # Look for specific patterns in descendant names and content. A frame
+    # counts as CRUD when any text below it does, so text hits are pushed up
+    # to their ancestors in one bottom-up sweep instead of re-walking every
+    # frame's subtree for its text.
+    nodes: list[PenNode] = []
+    parents: list[int] = []
+    text_hits: list[bool] = []
+    stack = [(node, -1)]
+    while stack:
+        n, parent = stack.pop()
+        nodes.append(n)
+        parents.append(parent)
+        content = n.properties.get("content", "") if n.type == "text" else ""
+        text_hits.append(bool(content) and _CRUD_TEXT_RE.search(_word_key(content)) is not None)
+        if n.children:
+            idx = len(nodes) - 1
+            stack.extend((child, idx) for child in reversed(n.children))
+
+    for i in range(len(nodes) - 1, 0, -1):
+        if text_hits[i]:
+            text_hits[parents[i]] = True
+
+    for n, has_crud_text in zip(nodes, text_hits):
+        mask = _FEATURE_MATCHER.mask(_word_key(n.name)) if n.name else 0
+        if has_crud_text and n.type == "frame":
+            mask |= _CRUD_BIT
+        if mask:
+            counts.update(_mask_keys(mask))
+
+    return dict(counts)
 
 
 class ScreenDetector(BaseDetector):
@@ -111,28 +174,20 @@ class ScreenDetector(BaseDetector):
     def detect(self, doc: PenDocument) -> list[dict]:
         features = []
 
-        for screen in doc.root.children:
-            if screen.type != "frame":
-                continue
-
-            # Skip design system containers
-            if screen.name and screen.name.lower() in _SYSTEM_NAMES:
-                continue
-            if screen.reusable:
-                continue
+        for screen in filter(_is_screen_frame, doc.root.children):
+            # Node types, text content, size and depth in a single walk
+            type_counts, texts, node_count, depth = _scan_subtree(screen)
 
             # Detect platform and features
             platform = _detect_platform(screen)
-            feature_counts = _count_features(screen)
+            feature_counts = _count_features(screen, type_counts)
             tier = classify_screen_tier(feature_counts)
 
             # Extract text content for description
-            texts = screen.find_text_content()
             heading = texts[0] if texts else screen.name
 
             # Count child elements
-            child_count = sum(1 for _ in screen.walk()) - 1  # exclude self
-            depth = screen.depth()
+            child_count = node_count - 1  # exclude self
 
             features.append(make_feature(
                 detector="screen",
@@ -149,7 +204,7 @@ class ScreenDetector(BaseDetector):
                     "child_count": child_count,
                     "depth": depth,
                     "feature_counts": feature_counts,
-                    "node_types": screen.count_by_type(),
+                    "node_types": type_counts,
                 },
             ))
 
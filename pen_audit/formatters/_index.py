@@ -0,0 +1,24 @@
+"""Shared feature grouping for the per-screen formatters."""
+
+from __future__ import annotations
+
+
+def build_screen_index(state: dict) -> dict[str, dict]:
+    """Group features under the screen they belong to.
+
+    Returns ``{screen_name: {"screen": feature, "sub_features": [...]}}`` in
+    feature order. Sub-features are attached via ``detail.screen_name``; ones
+    whose screen was not detected are dropped.
+    """
+    features = state.get("features", {}).values()
+    screens: dict[str, dict] = {}
+    for f in features:
+        if f["category"] == "screen":
+            screens[f["name"]] = {"screen": f, "sub_features": []}
+
+    for f in features:
+        if f["category"] != "screen":
+            screen_name = f["detail"].get("screen_name", "Unknown")
+            if screen_name in screens:
+                screens[screen_name]["sub_features"].append(f)
+    return screens
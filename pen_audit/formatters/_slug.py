@@ -0,0 +1,18 @@
+"""URL slug helper shared by the page stub and test skeleton formatters."""
+
+from __future__ import annotations
+
+import re
+
+_RE_NON_SLUG = re.compile(r'[^a-z0-9\s-]')
+_RE_SEPARATORS = re.compile(r'[\s_]+')
+_RE_DASHES = re.compile(r'-+')
+
+
+def slugify(name: str) -> str:
+    """Convert a screen name to a URL path segment."""
+    slug = name.lower().strip()
+    slug = _RE_NON_SLUG.sub('', slug)
+    slug = _RE_SEPARATORS.sub('-', slug)
+    slug = _RE_DASHES.sub('-', slug).strip('-')
+    return slug
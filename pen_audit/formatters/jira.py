@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from ._index import build_screen_index
 from ..scoring import TIER_NAMES, TIER_DESCRIPTIONS
 
+# Overview line prefix per tier, built once instead of per screen
+_TIER_OVERVIEW = {tier: f"Tier {tier} ({desc})" for tier, desc in TIER_DESCRIPTIONS.items()}
+
 
 def _adf_paragraph(text: str) -> dict:
     return {"type": "paragraph", "content": [{"type": "text", "text": text}]}
@@ -14,12 +18,13 @@ def _adf_heading(text: str, level: int = 3) -> dict:
 
 
 def _adf_bullet_list(items: list[str]) -> dict:
+    # Paragraphs built inline: this runs once per bullet across every task
     return {
         "type": "bulletList",
         "content": [
             {
                 "type": "listItem",
-                "content": [_adf_paragraph(item)],
+                "content": [{"type": "paragraph", "content": [{"type": "text", "text": item}]}],
             }
             for item in items
         ],
@@ -34,7 +39,7 @@ def _adf_status(text: str, color: str = "neutral") -> dict:
     }
 
 
-def generate_jira_tasks(state: dict) -> list[dict]:
+def generate_jira_tasks(state: dict, screens: dict[str, dict] | None = None) -> list[dict]:
     """Generate Jira-ready task payloads from state.
 
     Returns a list of dicts, each with:
@@ -45,20 +50,10 @@ def generate_jira_tasks(state: dict) -> list[dict]:
     - screen_name: str
     - pen_node_id: str
     """
-    features = list(state.get("features", {}).values())
     tasks = []
 
-    # Group features by screen
-    screens: dict[str, dict] = {}
-    for f in features:
-        if f["category"] == "screen":
-            screens[f["name"]] = {"screen": f, "sub_features": []}
-
-    for f in features:
-        if f["category"] != "screen":
-            screen_name = f["detail"].get("screen_name", "Unknown")
-            if screen_name in screens:
-                screens[screen_name]["sub_features"].append(f)
+    if screens is None:
+        screens = build_screen_index(state)
 
     for name, data in screens.items():
         screen_f = data["screen"]
@@ -66,7 +61,8 @@ def generate_jira_tasks(state: dict) -> list[dict]:
             continue
 
         tier = screen_f["tier"]
-        platform = screen_f["detail"].get("platform", "unknown")
+        detail = screen_f["detail"]
+        platform = detail.get("platform", "unknown")
         node_id = screen_f["screen_id"]
         sub_features = data["sub_features"]
 
@@ -76,11 +72,10 @@ def generate_jira_tasks(state: dict) -> list[dict]:
         # Overview
         adf_content.append(_adf_heading(f"Screen: {name}", 2))
         adf_content.append(_adf_paragraph(
-            f"Tier {tier} ({TIER_DESCRIPTIONS.get(tier, '?')}) — {platform} platform"
+            f"{_TIER_OVERVIEW.get(tier) or f'Tier {tier} (?)'} — {platform} platform"
         ))
 
         # Dimensions and stats
-        detail = screen_f.get("detail", {})
         adf_content.append(_adf_heading("Specifications", 3))
         specs = [
             f"Dimensions: {detail.get('width', '?')} x {detail.get('height', '?')}",
@@ -93,10 +88,7 @@ def generate_jira_tasks(state: dict) -> list[dict]:
         # Sub-features as acceptance criteria
         if sub_features:
             adf_content.append(_adf_heading("Acceptance Criteria", 3))
-            criteria = []
-            for sf in sub_features:
-                criteria.append(f"[{sf['detector']}] {sf['summary']}")
-            adf_content.append(_adf_bullet_list(criteria))
+            adf_content.append(_adf_bullet_list([f"[{sf['detector']}] {sf['summary']}" for sf in sub_features]))
 
         # Feature counts
         fc = detail.get("feature_counts", {})
@@ -107,10 +99,9 @@ def generate_jira_tasks(state: dict) -> list[dict]:
                 adf_content.append(_adf_bullet_list(patterns))
 
         # Labels
-        labels = [f"tier-{tier}", f"platform-{platform}", "pen-audit"]
-        for sf in sub_features:
-            labels.append(f"has-{sf['detector']}")
-        labels = sorted(set(labels))
+        labels = {f"tier-{tier}", f"platform-{platform}", "pen-audit"}
+        labels.update(f"has-{sf['detector']}" for sf in sub_features)
+        labels = sorted(labels)
 
         tasks.append({
             "summary": f"[T{tier}] Implement {name} screen ({platform})",
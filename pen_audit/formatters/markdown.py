@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import io
+
 from ..scoring import TIER_NAMES, TIER_DESCRIPTIONS
 
 
@@ -11,29 +13,28 @@ def generate_markdown(state: dict) -> str:
     stats = state.get("stats", {})
     source = state.get("source_file", "unknown")
 
-    lines = [
-        "# Feature Inventory",
-        "",
-        f"**Source**: `{source}`",
-        f"**Total features**: {stats.get('total', 0)}",
-        f"**Completion**: {stats.get('pct', 0)}%",
-        "",
-        "## Summary",
-        "",
-    ]
+    buf = io.StringIO()
+    w = buf.write
+    # Every chunk ends with a newline; blank separator lines lead the chunk
+    # that follows them, so nothing trails the last section.
+    w(f"""# Feature Inventory
+
+**Source**: `{source}`
+**Total features**: {stats.get('total', 0)}
+**Completion**: {stats.get('pct', 0)}%
+
+## Summary
+
+| Tier | Type | Total | Done | Open |
+|------|------|-------|------|------|
+""")
 
     # Tier summary
     by_tier = stats.get("by_tier", {})
-    lines.append("| Tier | Type | Total | Done | Open |")
-    lines.append("|------|------|-------|------|------|")
-    for tier in sorted(by_tier.keys(), key=int):
-        ts = by_tier[tier]
-        tier_int = int(tier)
-        open_count = ts["total"] - ts["done"]
-        lines.append(
-            f"| T{tier} | {TIER_NAMES.get(tier_int, '?')} | {ts['total']} | {ts['done']} | {open_count} |"
-        )
-    lines.append("")
+    w("".join(
+        f"| T{tier} | {TIER_NAMES.get(int(tier), '?')} | {ts['total']} | {ts['done']} | {ts['total'] - ts['done']} |\n"
+        for tier, ts in sorted(by_tier.items(), key=lambda item: int(item[0]))
+    ))
 
     # Group by screen
     screens: dict[str, list[dict]] = {}
@@ -51,45 +52,47 @@ def generate_markdown(state: dict) -> str:
             screens[screen_name]["features"].append(f)
 
     # Screens section
-    lines.append("## Screens")
-    lines.append("")
+    w("\n## Screens\n")
 
     for name, data in sorted(screens.items()):
         screen_f = data.get("screen")
-        tier = screen_f["tier"] if screen_f else 2
-        platform = screen_f["detail"].get("platform", "unknown") if screen_f else ""
-        status = screen_f["status"] if screen_f else "open"
+        if screen_f:
+            detail = screen_f["detail"]
+            tier, platform, status = screen_f["tier"], detail.get("platform", "unknown"), screen_f["status"]
+        else:
+            tier, platform, status = 2, "", "open"
         icon = "x" if status == "implemented" else " "
 
-        lines.append(f"### [{icon}] {name} (T{tier}, {platform})")
-        lines.append("")
+        w(f"\n### [{icon}] {name} (T{tier}, {platform})\n\n")
 
         if screen_f:
-            detail = screen_f.get("detail", {})
-            lines.append(f"- **Dimensions**: {detail.get('width', '?')} x {detail.get('height', '?')}")
-            lines.append(f"- **Elements**: {detail.get('child_count', 0)} nodes, depth {detail.get('depth', 0)}")
+            w(f"""- **Dimensions**: {detail.get('width', '?')} x {detail.get('height', '?')}
+- **Elements**: {detail.get('child_count', 0)} nodes, depth {detail.get('depth', 0)}
+""")
 
         screen_features = data.get("features", [])
         if screen_features:
-            lines.append(f"- **Sub-features**: {len(screen_features)}")
-            for sf in screen_features:
-                sf_icon = "x" if sf["status"] == "implemented" else " "
-                lines.append(f"  - [{sf_icon}] {sf['summary']}")
-
-        lines.append("")
+            w(f"- **Sub-features**: {len(screen_features)}\n")
+            w("".join(
+                f"  - [{'x' if sf['status'] == 'implemented' else ' '}] {sf['summary']}\n"
+                for sf in screen_features
+            ))
 
     # Components section
     if components:
-        lines.append("## Design System Components")
-        lines.append("")
-        lines.append("| Component | Usage | Screens |")
-        lines.append("|-----------|-------|---------|")
+        w("""
+## Design System Components
+
+| Component | Usage | Screens |
+|-----------|-------|---------|
+""")
         for comp in sorted(components, key=lambda x: x["detail"].get("usage_count", 0), reverse=True):
-            usage = comp["detail"].get("usage_count", 0)
-            screen_list = ", ".join(comp["detail"].get("screens_used", [])[:3])
-            if len(comp["detail"].get("screens_used", [])) > 3:
+            comp_detail = comp["detail"]
+            usage = comp_detail.get("usage_count", 0)
+            screens_used = comp_detail.get("screens_used", [])
+            screen_list = ", ".join(screens_used[:3])
+            if len(screens_used) > 3:
                 screen_list += "..."
-            lines.append(f"| {comp['name']} | {usage}x | {screen_list} |")
-        lines.append("")
+            w(f"| {comp['name']} | {usage}x | {screen_list} |\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()
@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import re
 
+# Unlike the page-stub slug, route slugs keep unicode word characters
+_RE_NON_WORD = re.compile(r'[^\w\s-]')
+_RE_SEPARATORS = re.compile(r'[\s_]+')
+
 
 def _slugify(name: str) -> str:
     """Convert a screen name to a URL slug."""
     slug = name.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
+    slug = _RE_NON_WORD.sub('', slug)
+    slug = _RE_SEPARATORS.sub('-', slug)
     return slug
 
 
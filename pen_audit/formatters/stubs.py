@@ -3,20 +3,24 @@
 from __future__ import annotations
 
 import re
+from itertools import chain
 
+from ._index import build_screen_index
+from ._slug import slugify
 
-def _slugify(name: str) -> str:
-    """Convert screen name to URL path segment."""
-    slug = name.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug).strip('-')
-    return slug
+_RE_NON_IDENT = re.compile(r'[^a-zA-Z0-9\s]')
+# Same deletion as _RE_NON_IDENT for ASCII names, without the regex engine
+_ASCII_NON_IDENT = str.maketrans(
+    {c: None for c in map(chr, range(128)) if not (c.isalnum() or c.isspace())}
+)
 
 
 def _component_name(name: str) -> str:
     """Convert screen name to PascalCase component name."""
-    parts = re.sub(r'[^a-zA-Z0-9\s]', '', name).split()
+    if name.isascii():
+        parts = name.translate(_ASCII_NON_IDENT).split()
+    else:
+        parts = _RE_NON_IDENT.sub('', name).split()
     result = ''.join(p.capitalize() for p in parts) or 'Page'
     # Ensure it doesn't start with a digit
     if result[0].isdigit():
@@ -24,7 +28,21 @@ def _component_name(name: str) -> str:
     return result
 
 
-def generate_stubs(state: dict, app_dir: str = "app") -> list[dict]:
+# Placeholder comment text per sub-feature detector, from its detail
+_JSX_PLACEHOLDERS = {
+    "navigation": lambda d: f'{d.get("pattern_type", "nav")} navigation',
+    "form": lambda d: f'form with {d.get("input_count", 0)} inputs',
+    "data_display": lambda d: f'{d.get("pattern", "data")} display ({len(d.get("instances", []))} items)',
+    "crud": lambda d: f'CRUD operations: {", ".join(d.get("operations", {}).keys())}',
+    "interactive": lambda d: f'{d.get("pattern", "interactive")} interaction',
+}
+
+
+def generate_stubs(
+    state: dict,
+    app_dir: str = "app",
+    screens: dict[str, dict] | None = None,
+) -> list[dict]:
     """Generate Next.js App Router page stubs from detected screens.
 
     Returns list of dicts with:
@@ -33,27 +51,17 @@ def generate_stubs(state: dict, app_dir: str = "app") -> list[dict]:
     - screen_name: str
     - tier: int
     """
-    features = list(state.get("features", {}).values())
     stubs = []
 
-    # Collect screen features with their sub-features
-    screens: dict[str, dict] = {}
-    for f in features:
-        if f["category"] == "screen":
-            screens[f["name"]] = {"screen": f, "sub_features": []}
-
-    for f in features:
-        if f["category"] != "screen":
-            screen_name = f["detail"].get("screen_name", "Unknown")
-            if screen_name in screens:
-                screens[screen_name]["sub_features"].append(f)
+    if screens is None:
+        screens = build_screen_index(state)
 
     for name, data in screens.items():
         screen_f = data["screen"]
         if screen_f["status"] != "open":
             continue
 
-        slug = _slugify(name)
+        slug = slugify(name)
         comp = _component_name(name)
         tier = screen_f["tier"]
         platform = screen_f["detail"].get("platform", "unknown")
@@ -89,24 +97,11 @@ def generate_stubs(state: dict, app_dir: str = "app") -> list[dict]:
         jsx_parts.append(f'      <main className="flex-1 p-4">')
 
         # Add placeholder sections based on sub-features
-        for sf in sub_features:
-            det = sf["detector"]
-            if det == "navigation":
-                pattern = sf["detail"].get("pattern_type", "nav")
-                jsx_parts.append(f'        {{/* TODO: {pattern} navigation */}}')
-            elif det == "form":
-                count = sf["detail"].get("input_count", 0)
-                jsx_parts.append(f'        {{/* TODO: form with {count} inputs */}}')
-            elif det == "data_display":
-                pattern = sf["detail"].get("pattern", "data")
-                instances = sf["detail"].get("instances", [])
-                jsx_parts.append(f'        {{/* TODO: {pattern} display ({len(instances)} items) */}}')
-            elif det == "crud":
-                ops = sf["detail"].get("operations", {})
-                jsx_parts.append(f'        {{/* TODO: CRUD operations: {", ".join(ops.keys())} */}}')
-            elif det == "interactive":
-                pattern = sf["detail"].get("pattern", "interactive")
-                jsx_parts.append(f'        {{/* TODO: {pattern} interaction */}}')
+        jsx_parts.extend(
+            f'        {{/* TODO: {_JSX_PLACEHOLDERS[sf["detector"]](sf["detail"])} */}}'
+            for sf in sub_features
+            if sf["detector"] in _JSX_PLACEHOLDERS
+        )
 
         if not sub_features:
             jsx_parts.append(f'        <p className="text-muted-foreground">Coming Soon</p>')
@@ -115,20 +110,20 @@ def generate_stubs(state: dict, app_dir: str = "app") -> list[dict]:
         jsx_parts.append(f'    </div>')
 
         # Assemble
-        content_lines = imports + ['', '', f'export default function {comp}Page() {{']
-        content_lines.extend(body_parts)
-        content_lines.append('')
-        content_lines.append('  return (')
-        content_lines.extend(jsx_parts)
-        content_lines.append('  );')
-        content_lines.append('}')
-        content_lines.append('')
+        content = '\n'.join(chain(
+            imports,
+            ('', '', f'export default function {comp}Page() {{'),
+            body_parts,
+            ('', '  return ('),
+            jsx_parts,
+            ('  );', '}', ''),
+        ))
 
         file_path = f"{app_dir}/app/{slug}/page.tsx"
 
         stubs.append({
             "path": file_path,
-            "content": '\n'.join(content_lines),
+            "content": content,
             "screen_name": name,
             "tier": tier,
         })
@@ -3,22 +3,82 @@
 from __future__ import annotations
 
 import re
+from itertools import chain
 
+from ._index import build_screen_index
+from ._slug import slugify
 
-def _slugify(name: str) -> str:
-    slug = name.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug).strip('-')
-    return slug
+_RE_NON_ALNUM = re.compile(r'[^a-zA-Z0-9]')
+# Same replacement as _RE_NON_ALNUM for ASCII names, without the regex engine
+_ASCII_NON_ALNUM_TO_UNDERSCORE = str.maketrans(
+    {c: '_' for c in map(chr, range(128)) if not c.isalnum()}
+)
 
 
 def _test_id(name: str) -> str:
     """Generate a test-friendly identifier."""
-    return re.sub(r'[^a-zA-Z0-9]', '_', name).strip('_').lower()
+    if name.isascii():
+        return name.translate(_ASCII_NON_ALNUM_TO_UNDERSCORE).strip('_').lower()
+    return _RE_NON_ALNUM.sub('_', name).strip('_').lower()
 
 
-def generate_test_skeletons(state: dict) -> list[dict]:
+def _skipped_test(title: str, *comments: str) -> list[str]:
+    return [
+        f'  test("{title}", async ({{ page }}) => {{',
+        *(f'    // {comment}' for comment in comments),
+        f'    test.skip(); // stub',
+        f'  }});',
+        '',
+    ]
+
+
+def _navigation_tests(detail: dict) -> list[str]:
+    pattern = detail.get("pattern_type", "nav")
+    return _skipped_test(f"has {pattern} navigation", f"TODO: verify {pattern} elements")
+
+
+def _form_tests(detail: dict) -> list[str]:
+    count = detail.get("input_count", 0)
+    input_types = detail.get("input_types", [])
+    return [
+        *_skipped_test(
+            f"renders form with {count} inputs",
+            f'Input types: {", ".join(input_types)}',
+            "TODO: verify form inputs render",
+        ),
+        *_skipped_test("validates form inputs", "TODO: test validation rules"),
+    ]
+
+
+def _data_display_tests(detail: dict) -> list[str]:
+    pattern = detail.get("pattern", "data")
+    return _skipped_test(f"displays {pattern} data", f"TODO: verify {pattern} renders with data")
+
+
+def _crud_tests(detail: dict) -> list[str]:
+    return [
+        line
+        for op in detail.get("operations", {})
+        for line in _skipped_test(f"supports {op} operation", f"TODO: test {op} flow")
+    ]
+
+
+def _interactive_tests(detail: dict) -> list[str]:
+    pattern = detail.get("pattern", "interactive")
+    return _skipped_test(f"{pattern} interaction works", f"TODO: test {pattern} behavior")
+
+
+# Test stub emitters per sub-feature detector
+_SUB_FEATURE_TESTS = {
+    "navigation": _navigation_tests,
+    "form": _form_tests,
+    "data_display": _data_display_tests,
+    "crud": _crud_tests,
+    "interactive": _interactive_tests,
+}
+
+
+def generate_test_skeletons(state: dict, screens: dict[str, dict] | None = None) -> list[dict]:
     """Generate Playwright E2E test skeletons from detected screens.
 
     Returns list of dicts with:
@@ -27,32 +87,22 @@ def generate_test_skeletons(state: dict) -> list[dict]:
     - screen_name: str
     - tier: int
     """
-    features = list(state.get("features", {}).values())
     tests = []
 
-    # Collect screen features with their sub-features
-    screens: dict[str, dict] = {}
-    for f in features:
-        if f["category"] == "screen":
-            screens[f["name"]] = {"screen": f, "sub_features": []}
-
-    for f in features:
-        if f["category"] != "screen":
-            screen_name = f["detail"].get("screen_name", "Unknown")
-            if screen_name in screens:
-                screens[screen_name]["sub_features"].append(f)
+    if screens is None:
+        screens = build_screen_index(state)
 
     for name, data in screens.items():
         screen_f = data["screen"]
         if screen_f["status"] != "open":
             continue
 
-        slug = _slugify(name)
+        slug = slugify(name)
         tid = _test_id(name)
         tier = screen_f["tier"]
         sub_features = data["sub_features"]
 
-        lines = [
+        header = [
             f'import {{ test, expect }} from "@playwright/test";',
             f'import {{ auth }} from "./helpers/auth";',
             '',
@@ -69,70 +119,18 @@ def generate_test_skeletons(state: dict) -> list[dict]:
         ]
 
         # Generate test stubs for each sub-feature
-        for sf in sub_features:
-            det = sf["detector"]
-            if det == "navigation":
-                pattern = sf["detail"].get("pattern_type", "nav")
-                lines.extend([
-                    f'  test("has {pattern} navigation", async ({{ page }}) => {{',
-                    f'    // TODO: verify {pattern} elements',
-                    f'    test.skip(); // stub',
-                    f'  }});',
-                    '',
-                ])
-            elif det == "form":
-                count = sf["detail"].get("input_count", 0)
-                input_types = sf["detail"].get("input_types", [])
-                lines.extend([
-                    f'  test("renders form with {count} inputs", async ({{ page }}) => {{',
-                    f'    // Input types: {", ".join(input_types)}',
-                    f'    // TODO: verify form inputs render',
-                    f'    test.skip(); // stub',
-                    f'  }});',
-                    '',
-                    f'  test("validates form inputs", async ({{ page }}) => {{',
-                    f'    // TODO: test validation rules',
-                    f'    test.skip(); // stub',
-                    f'  }});',
-                    '',
-                ])
-            elif det == "data_display":
-                pattern = sf["detail"].get("pattern", "data")
-                lines.extend([
-                    f'  test("displays {pattern} data", async ({{ page }}) => {{',
-                    f'    // TODO: verify {pattern} renders with data',
-                    f'    test.skip(); // stub',
-                    f'  }});',
-                    '',
-                ])
-            elif det == "crud":
-                ops = sf["detail"].get("operations", {})
-                for op in ops:
-                    lines.extend([
-                        f'  test("supports {op} operation", async ({{ page }}) => {{',
-                        f'    // TODO: test {op} flow',
-                        f'    test.skip(); // stub',
-                        f'  }});',
-                        '',
-                    ])
-            elif det == "interactive":
-                pattern = sf["detail"].get("pattern", "interactive")
-                lines.extend([
-                    f'  test("{pattern} interaction works", async ({{ page }}) => {{',
-                    f'    // TODO: test {pattern} behavior',
-                    f'    test.skip(); // stub',
-                    f'  }});',
-                    '',
-                ])
-
-        lines.append('});')
-        lines.append('')
+        sub_feature_tests = chain.from_iterable(
+            _SUB_FEATURE_TESTS[sf["detector"]](sf["detail"])
+            for sf in sub_features
+            if sf["detector"] in _SUB_FEATURE_TESTS
+        )
+        content = '\n'.join(chain(header, sub_feature_tests, ('});', '')))
 
         test_path = f"e2e/{tid}.spec.ts"
 
         tests.append({
             "path": test_path,
-            "content": '\n'.join(lines),
+            "content": content,
             "screen_name": name,
             "tier": tier,
         })
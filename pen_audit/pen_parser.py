@@ -26,19 +26,35 @@ Node types in .pen files:
 from __future__ import annotations
 
 import json
+import sys
+from collections import Counter
+from functools import cached_property
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple, Sequence
 from dataclasses import dataclass, field
 
+try:
+    import orjson  # optional: much faster JSON decoding (pip install pen-audit[fast])
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(slots=True)
 class PenNode:
     """Represents a node in the .pen file tree."""
     id: str
     type: str
     name: str = ""
-    children: list["PenNode"] = field(default_factory=list)
-    properties: dict = field(default_factory=dict)
+    # Parsed trees hold tuples; hand-built nodes default to a list they can append to
+    children: Sequence["PenNode"] = field(default_factory=list)
+    # Read-only on parsed trees, like children; hand-built nodes default to a dict
+    properties: Mapping[str, Any] = field(default_factory=dict)
     reusable: bool = False
+    # Slots leave no __dict__ for cached_property; the name properties below
+    # memoize into these instead
+    _name_lower: str | None = field(default=None, init=False, repr=False, compare=False)
+    _normalized_name: str | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def is_screen(self) -> bool:
@@ -55,11 +71,34 @@ class PenNode:
         """Component instances (ref nodes)."""
         return self.type == "ref"
 
+    @property
+    def name_lower(self) -> str:
+        """Lowercased name, computed once per node."""
+        lower = self._name_lower
+        if lower is None:
+            lower = self._name_lower = (self.name or "").lower()
+        return lower
+
+    @property
+    def normalized_name(self) -> str:
+        """Lowercased name with spaces and dashes folded to underscores, for keyword matching."""
+        key = self._normalized_name
+        if key is None:
+            key = self._normalized_name = self.name_lower.replace(" ", "_").replace("-", "_")
+        return key
+
     def walk(self):
         """Yield all nodes in the subtree (DFS)."""
-        yield self
-        for child in self.children:
-            yield from child.walk()
+        # Explicit stack: a recursive generator re-yields every node through
+        # each ancestor's frame, and deep trees would hit the recursion limit.
+        stack = [self]
+        pop = stack.pop
+        push = stack.extend
+        while stack:
+            node = pop()
+            yield node
+            if node.children:
+                push(reversed(node.children))
 
     def find_by_type(self, node_type: str) -> list["PenNode"]:
         """Find all descendant nodes of a given type."""
@@ -68,7 +107,7 @@ class PenNode:
     def find_by_name(self, pattern: str) -> list["PenNode"]:
         """Find all descendant nodes whose name contains the pattern (case-insensitive)."""
         pattern_lower = pattern.lower()
-        return [n for n in self.walk() if pattern_lower in n.name.lower()]
+        return [n for n in self.walk() if pattern_lower in n.name_lower]
 
     def find_text_content(self) -> list[str]:
         """Extract all text content from descendant text nodes."""
@@ -82,16 +121,26 @@ class PenNode:
 
     def count_by_type(self) -> dict[str, int]:
         """Count all node types in the subtree."""
-        counts: dict[str, int] = {}
-        for n in self.walk():
-            counts[n.type] = counts.get(n.type, 0) + 1
-        return counts
+        # Counter's C update loop; keys keep first-seen (pre-order) order
+        return dict(Counter(n.type for n in self.walk()))
 
     def depth(self) -> int:
         """Maximum depth of the subtree."""
-        if not self.children:
-            return 0
-        return 1 + max(child.depth() for child in self.children)
+        max_depth = 0
+        stack = [(self, 0)]
+        while stack:
+            node, d = stack.pop()
+            if d > max_depth:
+                max_depth = d
+            if node.children:
+                stack.extend((child, d + 1) for child in node.children)
+        return max_depth
+
+
+class NodeIndex(NamedTuple):
+    """Document-wide node lookups built by PenDocument.index."""
+    components: list[PenNode]
+    instances: list[PenNode]
 
 
 @dataclass
@@ -105,57 +154,118 @@ class PenDocument:
         """Top-level frames (screens)."""
         return [c for c in self.root.children if c.is_screen]
 
-    @property
-    def components(self) -> list[PenNode]:
-        """Reusable design system components."""
-        components = []
+    @cached_property
+    def index(self) -> NodeIndex:
+        """Reusable components and component instances, gathered in one walk.
+
+        Built on first use; the tree is treated as read-only once parsed.
+        """
+        components: list[PenNode] = []
+        instances: list[PenNode] = []
         for node in self.root.walk():
             if node.is_component:
                 components.append(node)
-        return components
+            if node.is_instance:
+                instances.append(node)
+        return NodeIndex(components=components, instances=instances)
+
+    @property
+    def components(self) -> list[PenNode]:
+        """Reusable design system components, including ones nested in other components."""
+        return list(self.index.components)
 
     @property
     def all_instances(self) -> list[PenNode]:
         """All component instances (ref nodes) across all screens."""
-        return [n for n in self.root.walk() if n.is_instance]
+        return list(self.index.instances)
+
+
+# Keys held in PenNode fields; with all_properties everything else goes to properties
+_NODE_FIELD_KEYS = frozenset({"id", "type", "name", "children", "reusable"})
+
+# The properties the detectors read; the rest (fills, fonts, layout, ...) is dropped
+# by default so large exports don't keep a copy of every raw attribute per node
+KEPT_PROPERTIES = ("content", "ref", "width", "height")
+
+
+# Parsed children are tuples: the tree is read-only once parsed, and tuples are
+# smaller than over-allocated lists. Leaves all share the one empty tuple.
+# Parsed properties are read-only mappings on every node, and nodes with none
+# of the kept properties share one empty mapping.
+_NO_CHILDREN: tuple = ()
+_NO_PROPERTIES = MappingProxyType({})
 
+# Longer strings (paragraph text) rarely repeat and aren't worth a pool entry.
+_POOLED_MAX_LEN = 64
 
-def _parse_node(data: dict) -> PenNode:
-    """Recursively parse a raw JSON node dict into a PenNode."""
-    children = []
-    raw_children = data.get("children", [])
-    if isinstance(raw_children, list):
-        for child_data in raw_children:
-            if isinstance(child_data, dict):
-                children.append(_parse_node(child_data))
 
-    # Extract known properties, pass the rest through
+def _new_node(data: dict, all_properties: bool, pool: dict[str, str]) -> PenNode:
+    """Build a PenNode from a raw JSON node dict, without its children.
+
+    Names and short string property values go through ``pool`` so repeats
+    ("Button", "#FFFFFF", component refs) share one string per parse.
+    """
+    if all_properties:
+        properties = {k: v for k, v in data.items() if k not in _NODE_FIELD_KEYS}
+    else:
+        properties = {k: data[k] for k in KEPT_PROPERTIES if k in data}
+    for k, v in properties.items():
+        if type(v) is str and len(v) < _POOLED_MAX_LEN:
+            properties[k] = pool.setdefault(v, v)
+
     node_id = data.get("id", "")
     node_type = data.get("type", "frame")
+    if type(node_type) is str:
+        # A handful of types repeat across every node; interning shares one
+        # string each and lets comparisons against the "frame"/"text"/"ref"
+        # literals succeed on identity.
+        node_type = sys.intern(node_type)
     name = data.get("name", "")
-    reusable = data.get("reusable", False)
-
-    # Collect all other properties
-    skip_keys = {"id", "type", "name", "children", "reusable"}
-    properties = {k: v for k, v in data.items() if k not in skip_keys}
+    if type(name) is str:
+        name = pool.setdefault(name, name)
 
     return PenNode(
         id=node_id,
         type=node_type,
         name=name,
-        children=children,
-        properties=properties,
-        reusable=reusable,
+        children=_NO_CHILDREN,
+        properties=MappingProxyType(properties) if properties else _NO_PROPERTIES,
+        reusable=data.get("reusable", False),
     )
 
 
-def parse_pen_json(data: dict) -> PenDocument:
-    """Parse a .pen JSON structure into a PenDocument."""
-    root = _parse_node(data)
+def _parse_node(data: dict, all_properties: bool = False) -> PenNode:
+    """Parse a raw JSON node dict and its descendants into a PenNode tree.
+
+    Iterative, so arbitrarily deep exports don't hit the recursion limit.
+    """
+    pool: dict[str, str] = {}
+    root = _new_node(data, all_properties, pool)
+    stack = [(root, data)]
+    while stack:
+        node, raw = stack.pop()
+        raw_children = raw.get("children", [])
+        if not isinstance(raw_children, list):
+            continue
+        parsed = [(_new_node(c, all_properties, pool), c) for c in raw_children if isinstance(c, dict)]
+        if parsed:
+            node.children = tuple([child for child, _ in parsed])
+            stack.extend(parsed)
+    return root
+
+
+def parse_pen_json(data: dict, all_properties: bool = False) -> PenDocument:
+    """Parse a .pen JSON structure into a PenDocument.
+
+    Node properties are limited to KEPT_PROPERTIES unless all_properties is set.
+    The returned tree is read-only: children are tuples and properties are
+    read-only mappings.
+    """
+    root = _parse_node(data, all_properties)
     return PenDocument(root=root)
 
 
-def load_pen_file(path: str | Path) -> PenDocument:
+def load_pen_file(path: str | Path, all_properties: bool = False) -> PenDocument:
     """Load and parse a .pen JSON export file.
 
     NOTE: Raw .pen files are encrypted. This expects a JSON export
@@ -165,9 +275,9 @@ def load_pen_file(path: str | Path) -> PenDocument:
     if not p.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    with open(p) as f:
-        data = json.load(f)
+    raw = p.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
-    doc = parse_pen_json(data)
+    doc = parse_pen_json(data, all_properties)
     doc.source_file = str(p)
     return doc
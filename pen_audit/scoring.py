@@ -27,6 +27,17 @@ TIER_DESCRIPTIONS = {
 TIER_WEIGHTS = {1: 1, 2: 2, 3: 4, 4: 8}
 
 
+# Feature types that put a screen in a tier, checked from the top tier down
+_TIER_INDICATORS = (
+    # T4: device APIs, real-time, animations
+    (4, frozenset({"camera", "scanner", "map", "video", "realtime", "animation", "device_api"})),
+    # T3: complex interactivity
+    (3, frozenset({"charts", "timers", "builders", "drag_drop", "swipe", "tabs_complex"})),
+    # T2: CRUD, forms, data display
+    (2, frozenset({"forms", "lists", "cards", "crud", "detail_view", "modals", "tabs"})),
+)
+
+
 def classify_screen_tier(feature_counts: dict[str, int]) -> int:
     """Classify a screen's implementation tier based on detected features.
 
@@ -37,20 +48,10 @@ def classify_screen_tier(feature_counts: dict[str, int]) -> int:
     Returns:
         Tier 1-4
     """
-    # T4 indicators: device APIs, real-time, animations
-    t4_indicators = ["camera", "scanner", "map", "video", "realtime", "animation", "device_api"]
-    if any(feature_counts.get(ind, 0) > 0 for ind in t4_indicators):
-        return 4
-
-    # T3 indicators: complex interactivity
-    t3_indicators = ["charts", "timers", "builders", "drag_drop", "swipe", "tabs_complex"]
-    if any(feature_counts.get(ind, 0) > 0 for ind in t3_indicators):
-        return 3
-
-    # T2 indicators: CRUD, forms, data display
-    t2_indicators = ["forms", "lists", "cards", "crud", "detail_view", "modals", "tabs"]
-    if any(feature_counts.get(ind, 0) > 0 for ind in t2_indicators):
-        return 2
+    present = feature_counts.keys()
+    for tier, indicators in _TIER_INDICATORS:
+        if any(feature_counts[ind] > 0 for ind in present & indicators):
+            return tier
 
     # T1: static content only
     return 1
@@ -92,14 +93,11 @@ def compute_completion(features: list[dict]) -> dict:
     pct = round((implemented / total) * 100, 1) if total > 0 else 0.0
 
     # Effort-weighted completion
-    total_effort = sum(
-        TIER_WEIGHTS.get(tier, 2) * ts["total"]
-        for tier, ts in by_tier.items()
-    )
-    done_effort = sum(
-        TIER_WEIGHTS.get(tier, 2) * ts["done"]
-        for tier, ts in by_tier.items()
-    )
+    total_effort = done_effort = 0
+    for tier, ts in by_tier.items():
+        weight = TIER_WEIGHTS.get(tier, 2)
+        total_effort += weight * ts["total"]
+        done_effort += weight * ts["done"]
     effort_score = round((done_effort / total_effort) * 100, 1) if total_effort > 0 else 0.0
 
     return {
@@ -5,12 +5,22 @@ Tracks detected features and their implementation status across scans.
 
 import json
 import os
+import pickle
 import sys
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .scoring import compute_completion
+from .utils import dump_json_bytes
+
+try:
+    import orjson  # optional: much faster JSON decoding (pip install pen-audit[fast])
+except ImportError:
+    orjson = None
+
+# json.loads takes bytes too, so both backends read the raw file
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 CURRENT_VERSION = 1
 
@@ -19,14 +29,25 @@ def _now() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
+# Exact-type fast path for the values state.json actually holds; subclasses
+# (e.g. PosixPath) fall through to the isinstance checks and are cached there.
+_DEFAULT_DISPATCH = {set: sorted, frozenset: sorted}
+
+
 def _json_default(obj):
-    if isinstance(obj, set):
-        return sorted(obj)
-    if isinstance(obj, Path):
-        return str(obj)
-    if hasattr(obj, "isoformat"):
+    convert = _DEFAULT_DISPATCH.get(type(obj))
+    if convert is not None:
+        return convert(obj)
+    if isinstance(obj, (set, frozenset)):
+        convert = sorted
+    elif isinstance(obj, Path):
+        convert = str
+    elif hasattr(obj, "isoformat"):
         return obj.isoformat()
-    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable: {obj!r}")
+    else:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable: {obj!r}")
+    _DEFAULT_DISPATCH[type(obj)] = convert
+    return convert(obj)
 
 
 def _empty_state() -> dict:
@@ -48,50 +69,149 @@ def get_state_path(project_dir: Path | None = None) -> Path:
     return base / ".pen-audit" / "state.json"
 
 
+def _cache_path(p: Path) -> Path:
+    return p.with_suffix(".pkl")
+
+
+def _stamp(p: Path) -> tuple[int, int]:
+    st = p.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    """Unpickler for JSON-typed data only: refuses to import any global.
+
+    The sidecar sits in whatever project directory the CLI runs in, so it is
+    untrusted input; without globals a pickle can't construct objects or call
+    functions, only rebuild dicts, lists, strings and numbers.
+    """
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"global {module}.{name} is not allowed in the state cache")
+
+
+def _read_cache(p: Path, stamp: tuple[int, int]) -> dict | None:
+    """Return the pickled copy of state.json if it was written for the file with this stamp."""
+    try:
+        with open(_cache_path(p), "rb") as f:
+            cached_stamp, data = _PlainUnpickler(f).load()
+        if cached_stamp == stamp:
+            return data
+    except Exception:
+        # Missing, foreign, truncated or tampered sidecar: fall back to the JSON
+        pass
+    return None
+
+
+def _write_cache(p: Path, state: dict, stamp: tuple[int, int]):
+    """Pickle freshly parsed state next to state.json under the stamp it was read with.
+
+    The sidecar is a disposable local cache: it always holds exactly what
+    json.loads returned, it is ignored as soon as the JSON changes (e.g.
+    after save_state), and failures to write it are not errors. The stamp
+    must be taken before the JSON is read: if another process replaces the
+    file in between, the cache is then filed under the old stamp and simply
+    never matches, instead of passing stale data off as the new file.
+    """
+    try:
+        with open(_cache_path(p), "wb") as f:
+            pickle.dump((stamp, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
 def load_state(path: Path | None = None) -> dict:
-    """Load state from disk, or return empty state."""
+    """Load state from disk, or return empty state.
+
+    A fresh pickle sidecar (see _write_cache) is used in place of parsing
+    the JSON, which makes back-to-back CLI commands cheaper.
+    """
     p = path or get_state_path()
-    if not p.exists():
+    try:
+        stamp = _stamp(p)
+    except OSError:
         return _empty_state()
 
+    cached = _read_cache(p, stamp)
+    if cached is not None:
+        return cached
+
     try:
-        data = json.loads(p.read_text())
+        data = _json_loads(p.read_bytes())
     except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
         backup = p.with_suffix(".json.bak")
         if backup.exists():
             try:
-                return json.loads(backup.read_text())
+                return _json_loads(backup.read_bytes())
             except (json.JSONDecodeError, UnicodeDecodeError):
                 pass
         print(f"  State file corrupted ({e}). Starting fresh.", file=sys.stderr)
         return _empty_state()
 
+    _intern_features(data)
+    _write_cache(p, data, stamp)
     return data
 
 
+# Feature fields drawn from a small set of values (detector, category, status,
+# scan timestamps) that json.loads would otherwise allocate once per feature.
+_INTERNED_FIELDS = ("detector", "screen_id", "category", "status", "first_seen", "last_seen")
+
+
+def _intern_features(state: dict):
+    """Share repeated feature strings so parsed state (and its pickle cache) stays small."""
+    intern = sys.intern
+    for f in state.get("features", {}).values():
+        for key in _INTERNED_FIELDS:
+            value = f.get(key)
+            if type(value) is str:
+                f[key] = intern(value)
+        screen_name = f.get("detail", {}).get("screen_name")
+        if type(screen_name) is str:
+            f["detail"]["screen_name"] = intern(screen_name)
+
+
+# Only the file contents need to be durable before the rename; skip the
+# metadata flush where the platform allows (fdatasync is missing on macOS)
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def _backup(p: Path, backup: Path):
+    """Keep the current state file as backup before it is replaced.
+
+    A hard link costs one metadata update instead of a full copy, and p stays
+    in place until os.replace swaps in the new file. Falls back to copying
+    where hard links aren't supported.
+    """
+    try:
+        backup.unlink(missing_ok=True)
+        os.link(p, backup)
+    except OSError:
+        try:
+            import shutil
+            shutil.copy2(str(p), str(backup))
+        except OSError:
+            pass
+
+
 def save_state(state: dict, path: Path | None = None):
     """Recompute stats and save to disk atomically."""
     _recompute_stats(state)
     p = path or get_state_path()
     p.parent.mkdir(parents=True, exist_ok=True)
 
-    content = json.dumps(state, indent=2, default=_json_default) + "\n"
+    content = dump_json_bytes(state, default=_json_default) + b"\n"
 
     try:
         fd, tmp_path = tempfile.mkstemp(dir=str(p.parent), suffix=".tmp")
         try:
-            os.write(fd, content.encode())
-            os.fsync(fd)
+            os.write(fd, content)
+            _fdatasync(fd)
         finally:
             os.close(fd)
 
         if p.exists():
-            backup = p.with_suffix(".json.bak")
-            try:
-                import shutil
-                shutil.copy2(str(p), str(backup))
-            except OSError:
-                pass
+            _backup(p, p.with_suffix(".json.bak"))
 
         os.replace(tmp_path, str(p))
     except OSError:
@@ -99,7 +219,7 @@ def save_state(state: dict, path: Path | None = None):
             os.unlink(tmp_path)
         except (OSError, UnboundLocalError):
             pass
-        p.write_text(content)
+        p.write_bytes(content)
 
 
 def _recompute_stats(state: dict):
@@ -165,8 +285,9 @@ def merge_scan(state: dict, features: list[dict], source_file: str = "") -> dict
 
     # Auto-resolve features that disappeared from the design
     removed = 0
-    for fid, old in existing.items():
-        if fid not in current_ids and old["status"] == "open":
+    for fid in existing.keys() - current_ids:
+        old = existing[fid]
+        if old["status"] == "open":
             old["status"] = "removed_from_design"
             removed += 1
 
@@ -184,12 +305,23 @@ def resolve_feature(state: dict, pattern: str, status: str) -> list[str]:
 
     Valid statuses: implemented, deferred, out_of_scope
     """
-    resolved = []
+    return resolve_features(state, [pattern], status)
+
+
+def resolve_features(state: dict, patterns: list[str], status: str) -> list[str]:
+    """Resolve features matching any of the patterns in a single pass.
+
+    Resolved IDs are grouped by the first pattern they matched, in pattern
+    order, so the result matches calling resolve_feature once per pattern.
+    """
+    buckets: list[list[str]] = [[] for _ in patterns]
     for fid, f in state["features"].items():
         if f["status"] != "open":
             continue
-        if fid == pattern or f["screen_id"] == pattern or pattern in fid:
-            f["status"] = status
-            resolved.append(fid)
+        for i, pattern in enumerate(patterns):
+            if f["screen_id"] == pattern or pattern in fid:
+                f["status"] = status
+                buckets[i].append(fid)
+                break
     _recompute_stats(state)
-    return resolved
+    return [fid for bucket in buckets for fid in bucket]
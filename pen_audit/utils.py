@@ -1,9 +1,16 @@
-"""Shared utilities: colors, output formatting."""
+"""Shared utilities: colors, output formatting, JSON encoding."""
 
 import io
+import json
 import os
+import re
 import sys
 
+try:
+    import orjson  # optional: much faster JSON encoding (pip install pen-audit[fast])
+except ImportError:
+    orjson = None
+
 # Force UTF-8 output on Windows to handle box/progress chars
 if sys.platform == "win32" and hasattr(sys.stdout, "buffer"):
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
@@ -24,10 +31,64 @@ COLORS = {
 NO_COLOR = os.environ.get("NO_COLOR") is not None
 
 
+def dump_json_bytes(obj, default=None) -> bytes:
+    """Encode obj as 2-space indented UTF-8 JSON, via orjson when installed.
+
+    Both backends produce the same bytes: non-ASCII is written as-is and
+    non-string dict keys (e.g. int tiers) become strings. Meant for files.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=default,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode()
+
+
+# Characters json.dumps escapes by default (DEL and everything non-ASCII) but
+# orjson writes raw. They can only occur inside JSON strings, so escaping them
+# in the encoded text reproduces json.dumps' ensure_ascii output.
+_RE_NON_ASCII = re.compile("[\x7f-\U0010ffff]")
+
+
+def _escape_non_ascii(m: re.Match) -> str:
+    cp = ord(m.group())
+    if cp < 0x10000:
+        return f"\\u{cp:04x}"
+    cp -= 0x10000
+    return f"\\u{0xd800 | cp >> 10:04x}\\u{0xdc00 | cp & 0x3ff:04x}"
+
+
+def dump_json(obj, default=None) -> str:
+    """Like dump_json_bytes, but returns ASCII-only text for printing.
+
+    Non-ASCII is \\u-escaped as json.dumps does by default, so the output
+    prints on any stdout encoding.
+    """
+    if orjson is None:
+        return json.dumps(obj, indent=2, default=default)
+    return _RE_NON_ASCII.sub(_escape_non_ascii, dump_json_bytes(obj, default).decode())
+
+
+_RESET = COLORS["reset"]
+
+# (stream, colors enabled) for the last sys.stdout seen; isatty() is checked
+# once per stream rather than on every call, and redirecting stdout (as test
+# capture does) triggers a fresh check.
+_color_state: tuple[object, bool] | None = None
+
+
+def _color_enabled() -> bool:
+    global _color_state
+    out = sys.stdout
+    state = _color_state
+    if state is None or state[0] is not out:
+        state = _color_state = (out, not NO_COLOR and out.isatty())
+    return state[1]
+
+
 def c(text: str, color: str) -> str:
-    if NO_COLOR or not sys.stdout.isatty():
+    if not _color_enabled():
         return str(text)
-    return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
+    return f"{COLORS.get(color, '')}{text}{_RESET}"
 
 
 def log(msg: str):
@@ -37,16 +98,23 @@ def log(msg: str):
 def print_table(headers: list[str], rows: list[list[str]], widths: list[int] | None = None):
     if not rows:
         return
+    # Stringify each cell once; widths and the printed rows both use it
+    cells = [[str(v) for v in row] for row in rows]
     if not widths:
-        widths = [max(len(str(h)), *(len(str(r[i])) for r in rows)) for i, h in enumerate(headers)]
+        widths = [len(str(h)) for h in headers]
+        columns = range(len(widths))
+        for row in cells:
+            for i, v in zip(columns, row):
+                if len(v) > widths[i]:
+                    widths[i] = len(v)
     header_line = "  ".join(h.ljust(w) for h, w in zip(headers, widths))
     print(c(header_line, "bold"))
     try:
         print(c("─" * (sum(widths) + 2 * (len(widths) - 1)), "dim"))
     except UnicodeEncodeError:
         print(c("-" * (sum(widths) + 2 * (len(widths) - 1)), "dim"))
-    for row in rows:
-        print("  ".join(str(v).ljust(w) for v, w in zip(row, widths)))
+    for row in cells:
+        print("  ".join(v.ljust(w) for v, w in zip(row, widths)))
 
 
 def print_box(lines: list[str], width: int = 45):
@@ -0,0 +1,40 @@
+"""Tests for CLI plan output helpers."""
+
+from argparse import Namespace
+
+import pytest
+
+from pen_audit import cli
+from pen_audit.cli import _write_files
+from pen_audit.state import _empty_state, make_feature, merge_scan, save_state
+
+
+def test_write_files_last_duplicate_path_wins(tmp_path):
+    files = [
+        {"path": "app/page.tsx", "content": "first"},
+        {"path": "app/other/page.tsx", "content": "other"},
+        {"path": "app/page.tsx", "content": "last"},
+    ]
+    _write_files(tmp_path, files)
+    assert (tmp_path / "app" / "page.tsx").read_text() == "last"
+    assert (tmp_path / "app" / "other" / "page.tsx").read_text() == "other"
+
+
+def test_plan_reports_written_files_before_emitter_error(tmp_path, monkeypatch, capsys):
+    state = _empty_state()
+    merge_scan(state, [make_feature("screen", "s1", "Food Log", tier=1, category="screen", summary="Food Log")],
+               source_file="test.json")
+    state_path = tmp_path / "state.json"
+    save_state(state, state_path)
+
+    def broken(state, output_dir, screens):
+        raise RuntimeError("emitter failed")
+
+    monkeypatch.setitem(cli._PLAN_FORMATS, "jira", broken)
+    args = Namespace(state=str(state_path), format="all", output=str(tmp_path / "plan"))
+    with pytest.raises(RuntimeError, match="emitter failed"):
+        cli.cmd_plan(args)
+    out = capsys.readouterr().out
+    assert "feature-inventory.md" in out
+    assert "routes.json" in out
+    assert (tmp_path / "plan" / "routes.json").exists()
@@ -0,0 +1,88 @@
+"""Tests for matching features against a Next.js codebase."""
+
+from pathlib import Path
+
+from pen_audit.codebase_matcher import _PageIndex, _is_stub_page, match_codebase
+from pen_audit.state import _empty_state, make_feature, merge_scan
+
+
+def _write_page(app_dir, route: str, lines: list[str]) -> None:
+    page_dir = app_dir / route
+    page_dir.mkdir(parents=True, exist_ok=True)
+    (page_dir / "page.tsx").write_text("\n".join(lines) + "\n")
+
+
+def _real_page() -> list[str]:
+    return [f"// line {i}" for i in range(40)]
+
+
+def test_is_stub_page(tmp_path):
+    short = tmp_path / "short.tsx"
+    short.write_text("export default function P() {}\n")
+    assert _is_stub_page(short)
+
+    coming_soon = tmp_path / "coming_soon.tsx"
+    coming_soon.write_text("\n".join(["Coming soon"] + ["// x"] * 20))
+    assert _is_stub_page(coming_soon)
+
+    real = tmp_path / "real.tsx"
+    real.write_text("\n\n" + "\n".join(["Coming soon"] + ["// x"] * 40))
+    assert not _is_stub_page(real)
+
+    assert _is_stub_page(tmp_path / "missing.tsx")
+
+
+def test_match_codebase_strategies(tmp_path):
+    app_dir = tmp_path / "app"
+    _write_page(app_dir, "app/food-log", _real_page())
+    _write_page(app_dir, "settings/theme-picker", _real_page())
+    _write_page(app_dir, "recoverydetail", _real_page())
+    _write_page(app_dir, "app/login", ["Coming soon"])
+
+    state = _empty_state()
+    merge_scan(state, [
+        make_feature("screen", f"s{i}", name, tier=1, category="screen", summary=name)
+        for i, name in enumerate(["Food Log", "Theme Picker", "Recovery Detail", "Login", "Desktop App"])
+    ], source_file="test.json")
+
+    result = match_codebase(state, tmp_path, dry_run=True)
+    via = {m["screen_name"]: m["matched_via"] for m in result["matched"]}
+    assert via == {
+        "Food Log": "exact_slug",
+        "Theme Picker": "last_segment",
+        "Recovery Detail": "normalized",
+    }
+    assert [s["screen_name"] for s in result["stub"]] == ["Login"]
+    assert [m["screen_name"] for m in result["missing"]] == ["Desktop App"]
+
+
+def test_match_codebase_uses_routes_json(tmp_path):
+    app_dir = tmp_path / "app"
+    _write_page(app_dir, "program-builder", _real_page())
+    _write_page(app_dir, "app/builder/program-builder", _real_page())
+    (tmp_path / "routes.json").write_text(
+        '{"routes": [{"screen_name": "Builder", "path": "/app/builder/program-builder"}]}'
+    )
+
+    state = _empty_state()
+    merge_scan(state, [make_feature("screen", "s1", "Builder", tier=1, category="screen", summary="Builder")],
+               source_file="test.json")
+
+    result = match_codebase(state, tmp_path)
+    assert result["matched"][0]["matched_via"] == "routes.json"
+    assert result["matched"][0]["has_route"]
+    assert state["features"]["screen::s1::Builder"]["status"] == "implemented"
+
+
+def test_page_index_for_route_prefers_first_discovered_page():
+    slugs = ["app/meal-plan", "x/plan", "plan", "app/recoverydetail"]
+    index = _PageIndex({slug: Path(slug) for slug in slugs})
+    # "app/meal-plan" ends with the last segment and was discovered before the
+    # exact suffix match "plan"
+    assert index.for_route("app/plan") == "app/meal-plan"
+    assert index.for_route("detail") == "app/recoverydetail"  # plain endswith, mid-word
+    assert index.for_route("app/") == "app/meal-plan"  # empty last segment matches anything
+    assert index.for_route("app/settings") is None
+
+    reordered = _PageIndex({slug: Path(slug) for slug in reversed(slugs)})
+    assert reordered.for_route("app/plan") == "plan"
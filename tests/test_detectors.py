@@ -1,8 +1,11 @@
 """Tests for UI pattern detectors."""
 
-from pen_audit.pen_parser import parse_pen_json
+import pytest
+
+from pen_audit.pen_parser import PenDocument, parse_pen_json
 from pen_audit.detectors import run_all_detectors
-from pen_audit.detectors.screen import ScreenDetector
+from pen_audit.detectors._patterns import KeywordMatcher
+from pen_audit.detectors.screen import ScreenDetector, _count_features
 from pen_audit.detectors.component import ComponentDetector
 from pen_audit.detectors.navigation import NavigationDetector
 from pen_audit.detectors.form import FormDetector
@@ -10,7 +13,8 @@ from pen_audit.detectors.data_display import DataDisplayDetector
 from pen_audit.detectors.crud import CrudDetector
 
 
-def _sample_doc() -> dict:
+@pytest.fixture(scope="module")
+def detector_sample_raw() -> dict:
     return {
         "id": "root",
         "type": "frame",
@@ -82,10 +86,15 @@ def _sample_doc() -> dict:
     }
 
 
-def test_screen_detector():
-    doc = parse_pen_json(_sample_doc())
+@pytest.fixture(scope="module")
+def detector_sample_doc(detector_sample_raw) -> PenDocument:
+    """The parsed sample, shared by the tests in this module; detectors only read it."""
+    return parse_pen_json(detector_sample_raw)
+
+
+def test_screen_detector(detector_sample_doc):
     detector = ScreenDetector()
-    features = detector.detect(doc)
+    features = detector.detect(detector_sample_doc)
     names = [f["name"] for f in features]
     assert "Food Log" in names
     assert "Barcode Scanner" in names
@@ -93,10 +102,9 @@ def test_screen_detector():
     assert "SearchBar" not in names  # reusable component excluded
 
 
-def test_screen_tier_classification():
-    doc = parse_pen_json(_sample_doc())
+def test_screen_tier_classification(detector_sample_doc):
     detector = ScreenDetector()
-    features = detector.detect(doc)
+    features = detector.detect(detector_sample_doc)
     by_name = {f["name"]: f for f in features}
 
     # Settings = T1 (static, just toggle)
@@ -106,29 +114,76 @@ def test_screen_tier_classification():
     assert by_name["Food Log"]["tier"] >= 2  # has list + chart
 
 
-def test_component_detector():
-    doc = parse_pen_json(_sample_doc())
+def test_count_features_matches_whole_words():
+    doc = parse_pen_json({"id": "s", "type": "frame", "name": "Stats", "children": [
+        {"id": "a", "type": "frame", "name": "Activity Heatmap"},
+        {"id": "b", "type": "frame", "name": "sqRow"},
+        {"id": "c", "type": "frame", "name": "Meditation Header"},
+        {"id": "d", "type": "frame", "name": "mealList"},
+        {"id": "e", "type": "frame", "name": "Stat Cards"},
+        {"id": "f", "type": "frame", "name": "QRScanner"},
+        {"id": "g", "type": "frame", "name": "Mapping Rules"},
+        {"id": "h", "type": "frame", "name": "Roadmap"},
+        {"id": "i", "type": "frame", "name": "Textfield"},
+    ]})
+    counts = _count_features(doc.root)
+    assert "map" not in counts  # "Heatmap", "Mapping", "Roadmap"
+    assert counts["forms"] == 1  # "Textfield"
+    assert "crud" not in counts  # "Meditation"
+    assert counts["lists"] == 2  # camelCase words: "sqRow", "mealList"
+    assert counts["cards"] == 1  # plural
+    assert counts["camera"] == 1  # only "QRScanner", not "sqRow"
+
+
+def test_count_features_allows_plural_and_numbered_words():
+    doc = parse_pen_json({"id": "s", "type": "frame", "name": "Explore", "children": [
+        {"id": "a", "type": "frame", "name": "Maps"},
+        {"id": "b", "type": "frame", "name": "TextFields"},
+        {"id": "c", "type": "frame", "name": "mapView"},
+        {"id": "d", "type": "frame", "name": "tab2"},
+        {"id": "e", "type": "frame", "name": "tableHeader"},
+    ]})
+    counts = _count_features(doc.root)
+    assert counts["map"] == 2
+    assert counts["forms"] == 1
+    assert counts["tabs"] == 1  # numbered "tab2", not "tableHeader"
+
+
+def test_count_features_credits_crud_text_to_every_enclosing_frame():
+    doc = parse_pen_json({"id": "s", "type": "frame", "name": "Meals", "children": [
+        {"id": "a", "type": "frame", "name": "footer", "children": [
+            {"id": "b", "type": "frame", "name": "pill", "children": [
+                {"id": "t", "type": "text", "content": "Add meal"},
+            ]},
+        ]},
+        {"id": "c", "type": "frame", "name": "summary", "children": [
+            {"id": "u", "type": "text", "content": "Paddle board"},
+        ]},
+    ]})
+    # The screen, "footer" and "pill" all contain "Add meal"; "Paddle" is not the word "add"
+    assert _count_features(doc.root)["crud"] == 3
+
+
+def test_component_detector(detector_sample_doc):
     detector = ComponentDetector()
-    features = detector.detect(doc)
+    features = detector.detect(detector_sample_doc)
     assert len(features) == 1
     assert features[0]["name"] == "SearchBar"
     assert features[0]["detail"]["usage_count"] == 1
 
 
-def test_navigation_detector():
-    doc = parse_pen_json(_sample_doc())
+def test_navigation_detector(detector_sample_doc):
     detector = NavigationDetector()
-    features = detector.detect(doc)
+    features = detector.detect(detector_sample_doc)
     # Should find headers and back buttons
     patterns = [f["detail"]["pattern_type"] for f in features]
     assert "header" in patterns
     assert "back_button" in patterns
 
 
-def test_form_detector():
-    doc = parse_pen_json(_sample_doc())
+def test_form_detector(detector_sample_doc):
     detector = FormDetector()
-    features = detector.detect(doc)
+    features = detector.detect(detector_sample_doc)
     # SearchBar has search_input, Food Log screen has it via ref
     # The actual search_input is inside the reusable component,
     # but the component itself has reusable=True so it's not a screen
@@ -136,20 +191,18 @@ def test_form_detector():
     # This is expected — form detection works on node names
 
 
-def test_data_display_detector():
-    doc = parse_pen_json(_sample_doc())
+def test_data_display_detector(detector_sample_doc):
     detector = DataDisplayDetector()
-    features = detector.detect(doc)
+    features = detector.detect(detector_sample_doc)
     # Food Log has mealList (list) and calorie_chart (chart)
     patterns = [f["detail"]["pattern"] for f in features]
     assert "list" in patterns
     assert "chart" in patterns
 
 
-def test_crud_detector():
-    doc = parse_pen_json(_sample_doc())
+def test_crud_detector(detector_sample_doc):
     detector = CrudDetector()
-    features = detector.detect(doc)
+    features = detector.detect(detector_sample_doc)
     # Food Log has addFoodButton (create) and "Add Food" text
     assert len(features) >= 1
     food_log_crud = [f for f in features if "Food Log" in f["detail"].get("screen_name", "")]
@@ -158,9 +211,8 @@ def test_crud_detector():
     assert "create" in ops  # addFoodButton
 
 
-def test_run_all_detectors():
-    doc = parse_pen_json(_sample_doc())
-    features = run_all_detectors(doc)
+def test_run_all_detectors(detector_sample_doc):
+    features = run_all_detectors(detector_sample_doc)
     assert len(features) > 5  # Should find screens + components + navigation + etc.
 
     # Check all detectors contributed
@@ -168,3 +220,23 @@ def test_run_all_detectors():
     assert "screen" in detectors_found
     assert "component" in detectors_found
     assert "navigation" in detectors_found
+
+
+def test_run_all_detectors_matches_individual_detectors(detector_sample_doc):
+    detectors = [NavigationDetector(), FormDetector(), DataDisplayDetector(), CrudDetector()]
+    expected = {d.name: [f["id"] for f in d.detect(detector_sample_doc)] for d in detectors}
+    combined = run_all_detectors(detector_sample_doc)
+    for name, ids in expected.items():
+        assert [f["id"] for f in combined if f["detector"] == name] == ids
+
+
+def test_keyword_matcher_reports_overlapping_families():
+    matcher = KeywordMatcher([
+        ("nav", "tab_bar", ["tab_bar"]),
+        ("interactive", "tabs", ["tab"]),
+        ("crud", "create", ["add"]),
+        ("crud", "edit", ["pen"]),
+    ])
+    assert matcher.classify("tab_bar") == (("nav", ("tab_bar",)), ("interactive", ("tabs",)))
+    assert matcher.classify("addpencil") == (("crud", ("create", "edit")),)
+    assert matcher.classify("title") == ()
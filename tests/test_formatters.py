@@ -3,6 +3,7 @@
 from pen_audit.pen_parser import parse_pen_json
 from pen_audit.detectors import run_all_detectors
 from pen_audit.state import _empty_state, merge_scan
+from pen_audit.formatters._index import build_screen_index
 from pen_audit.formatters.markdown import generate_markdown
 from pen_audit.formatters.routes import generate_routes
 from pen_audit.formatters.jira import generate_jira_tasks
@@ -149,3 +150,16 @@ def test_test_skeletons_have_crud_tests():
     content = food_log_tests[0]["content"]
     # Food Log has CRUD (addFoodButton), so should have CRUD test stub
     assert "create" in content.lower()
+
+
+def test_screen_index_groups_sub_features():
+    state = _make_state()
+    screens = build_screen_index(state)
+    assert list(screens) == ["Food Log", "Settings"]
+    assert all(sf["detail"]["screen_name"] == "Food Log" for sf in screens["Food Log"]["sub_features"])
+    assert {sf["detector"] for sf in screens["Settings"]["sub_features"]} == {"navigation", "form"}
+
+    # A prebuilt index gives the same output as letting each formatter build its own
+    assert generate_jira_tasks(state, screens) == generate_jira_tasks(state)
+    assert generate_stubs(state, screens=screens) == generate_stubs(state)
+    assert generate_test_skeletons(state, screens) == generate_test_skeletons(state)
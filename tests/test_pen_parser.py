@@ -1,9 +1,14 @@
 """Tests for the .pen file parser."""
 
+import json
+
+import pytest
+
 from pen_audit.pen_parser import parse_pen_json, PenNode, PenDocument
 
 
-def _sample_doc() -> dict:
+@pytest.fixture(scope="module")
+def parser_sample_raw() -> dict:
     """A minimal .pen-like JSON structure for testing."""
     return {
         "id": "root",
@@ -83,16 +88,20 @@ def _sample_doc() -> dict:
     }
 
 
-def test_parse_basic():
-    doc = parse_pen_json(_sample_doc())
-    assert isinstance(doc, PenDocument)
-    assert doc.root.id == "root"
-    assert doc.root.type == "frame"
+@pytest.fixture(scope="module")
+def parser_sample_doc(parser_sample_raw) -> PenDocument:
+    """The parsed sample, shared by the tests in this module; treat it as read-only."""
+    return parse_pen_json(parser_sample_raw)
+
+
+def test_parse_basic(parser_sample_doc):
+    assert isinstance(parser_sample_doc, PenDocument)
+    assert parser_sample_doc.root.id == "root"
+    assert parser_sample_doc.root.type == "frame"
 
 
-def test_screens():
-    doc = parse_pen_json(_sample_doc())
-    screens = doc.screens
+def test_screens(parser_sample_doc):
+    screens = parser_sample_doc.screens
     # Should find Food Log and Settings (not the reusable component, not Design System)
     screen_names = [s.name for s in screens]
     assert "Food Log" in screen_names
@@ -101,54 +110,126 @@ def test_screens():
     assert "Design System" in screen_names  # not reusable, so included as screen
 
 
-def test_components():
-    doc = parse_pen_json(_sample_doc())
-    components = doc.components
+def test_components(parser_sample_doc):
+    components = parser_sample_doc.components
     assert len(components) == 1
     assert components[0].name == "SearchBar"
     assert components[0].reusable is True
 
 
-def test_instances():
-    doc = parse_pen_json(_sample_doc())
-    instances = doc.all_instances
+def test_instances(parser_sample_doc):
+    instances = parser_sample_doc.all_instances
     assert len(instances) == 1
     assert instances[0].type == "ref"
     assert instances[0].properties.get("ref") == "comp_search"
 
 
-def test_walk():
-    doc = parse_pen_json(_sample_doc())
-    food_log = [s for s in doc.screens if s.name == "Food Log"][0]
+def test_components_include_nested_reusable_nodes():
+    doc = parse_pen_json({"id": "r", "type": "frame", "children": [
+        {"id": "card", "type": "frame", "reusable": True, "children": [
+            {"id": "badge", "type": "frame", "reusable": True},
+        ]},
+    ]})
+    assert [n.id for n in doc.components] == ["card", "badge"]
+    assert [n.id for n in doc.index.components] == ["card", "badge"]
+
+
+def test_document_index(parser_sample_doc):
+    index = parser_sample_doc.index
+    assert parser_sample_doc.index is index  # built once
+    nodes = list(parser_sample_doc.root.walk())
+    assert index.instances == [n for n in nodes if n.type == "ref"]
+    assert [n.id for n in index.components] == ["comp_search"]
+
+
+def test_parse_keeps_only_detector_properties_by_default():
+    raw = {"id": "t", "type": "text", "content": "Hi", "fill": "#fff", "fontSize": 12}
+    assert parse_pen_json(raw).root.properties == {"content": "Hi"}
+    assert parse_pen_json(raw, all_properties=True).root.properties == {
+        "content": "Hi", "fill": "#fff", "fontSize": 12,
+    }
+
+
+def test_parsed_properties_are_read_only():
+    doc = parse_pen_json({"id": "r", "type": "frame", "children": [
+        {"id": "f", "type": "frame", "fill": "#fff"},
+        {"id": "t", "type": "text", "content": "Hi"},
+    ]})
+    for node in doc.root.children:
+        with pytest.raises(TypeError):
+            node.properties["content"] = "changed"
+    assert doc.root.children[1].properties == {"content": "Hi"}
+
+
+def test_parsed_leaves_share_empty_children_and_properties():
+    doc = parse_pen_json({"id": "r", "type": "frame", "children": [
+        {"id": "a", "type": "frame"}, {"id": "b", "type": "frame"},
+    ]})
+    assert isinstance(doc.root.children, tuple)
+    a, b = doc.root.children
+    assert a.children == () and a.children is b.children
+    assert a.properties == {} and a.properties is b.properties
+    assert PenNode(id="x", type="frame").children == []
+
+
+def test_parse_pools_repeated_strings():
+    raw = json.loads(
+        '{"id": "r", "type": "frame", "children": ['
+        '{"id": "a", "type": "text", "name": "Label", "content": "Save"},'
+        '{"id": "b", "type": "text", "name": "Label", "content": "Save"}]}'
+    )
+    a, b = parse_pen_json(raw).root.children
+    assert a.name is b.name
+    assert a.properties["content"] is b.properties["content"]
+
+
+def test_walk(parser_sample_doc):
+    food_log = [s for s in parser_sample_doc.screens if s.name == "Food Log"][0]
     all_nodes = list(food_log.walk())
     assert len(all_nodes) > 5  # Food Log has multiple children
+    # Pre-order: each node before its children, siblings in document order
+    assert [n.id for n in all_nodes][:5] == ["screen1", "header1", "title1", "back1", "search1"]
+
+
+def test_walk_and_depth_handle_deep_trees():
+    leaf = node = PenNode(id="n0", type="frame")
+    for i in range(1, 5000):
+        node = PenNode(id=f"n{i}", type="frame", children=[node])
+    assert sum(1 for _ in node.walk()) == 5000
+    assert node.depth() == 4999
+    assert leaf.depth() == 0
+
+
+def test_parse_deeply_nested_export():
+    data = {"id": "n0", "type": "text", "content": "leaf"}
+    for i in range(1, 5000):
+        data = {"id": f"n{i}", "type": "frame", "children": [data, "not-a-node"]}
+    doc = parse_pen_json(data)
+    assert doc.root.depth() == 4999
+    assert doc.root.find_text_content() == ["leaf"]
 
 
-def test_find_text_content():
-    doc = parse_pen_json(_sample_doc())
-    food_log = [s for s in doc.screens if s.name == "Food Log"][0]
+def test_find_text_content(parser_sample_doc):
+    food_log = [s for s in parser_sample_doc.screens if s.name == "Food Log"][0]
     texts = food_log.find_text_content()
     assert "Food Log" in texts
     assert "Add Food" in texts
 
 
-def test_count_by_type():
-    doc = parse_pen_json(_sample_doc())
-    food_log = [s for s in doc.screens if s.name == "Food Log"][0]
+def test_count_by_type(parser_sample_doc):
+    food_log = [s for s in parser_sample_doc.screens if s.name == "Food Log"][0]
     counts = food_log.count_by_type()
     assert counts["frame"] >= 3
     assert counts["text"] >= 1
     assert counts.get("ref", 0) >= 1
 
 
-def test_depth():
-    doc = parse_pen_json(_sample_doc())
-    food_log = [s for s in doc.screens if s.name == "Food Log"][0]
+def test_depth(parser_sample_doc):
+    food_log = [s for s in parser_sample_doc.screens if s.name == "Food Log"][0]
     assert food_log.depth() >= 2  # header > title
 
 
-def test_platform_detection():
-    doc = parse_pen_json(_sample_doc())
-    food_log = [s for s in doc.screens if s.name == "Food Log"][0]
+def test_platform_detection(parser_sample_doc):
+    food_log = [s for s in parser_sample_doc.screens if s.name == "Food Log"][0]
     # 390px wide = mobile
     assert food_log.properties.get("width") == 390
@@ -0,0 +1,153 @@
+"""Tests for persistent state management."""
+
+import pickle
+
+from pen_audit import state as state_module
+from pen_audit.state import (
+    _empty_state, load_state, make_feature, merge_scan, resolve_feature, resolve_features, save_state,
+)
+
+
+def _make_state() -> dict:
+    """Create a state with a few screens and sub-features."""
+    features = [
+        make_feature("screen", "s1", "Food Log", tier=2, category="screen", summary="Screen: Food Log"),
+        make_feature("crud", "s1", "Food Log::crud", tier=2, category="crud", summary="CRUD in Food Log"),
+        make_feature("screen", "s2", "Settings", tier=1, category="screen", summary="Screen: Settings"),
+        make_feature("navigation", "s2", "Settings::header", tier=1, category="navigation",
+                     summary="Nav: header in Settings"),
+    ]
+    state = _empty_state()
+    merge_scan(state, features, source_file="test.json")
+    return state
+
+
+def test_resolve_feature_by_screen_id():
+    state = _make_state()
+    resolved = resolve_feature(state, "s2", "implemented")
+    assert resolved == ["screen::s2::Settings", "navigation::s2::Settings::header"]
+    assert state["stats"]["implemented"] == 2
+
+
+def test_resolve_features_groups_by_pattern():
+    state = _make_state()
+    resolved = resolve_features(state, ["Settings", "Food Log"], "deferred")
+    assert resolved == [
+        "screen::s2::Settings",
+        "navigation::s2::Settings::header",
+        "screen::s1::Food Log",
+        "crud::s1::Food Log::crud",
+    ]
+    assert state["stats"]["deferred"] == 4
+
+
+def test_resolve_features_skips_already_resolved():
+    state = _make_state()
+    resolve_features(state, ["Settings"], "implemented")
+    resolved = resolve_features(state, ["Settings", "s1"], "deferred")
+    assert resolved == ["screen::s1::Food Log", "crud::s1::Food Log::crud"]
+    assert state["features"]["screen::s2::Settings"]["status"] == "implemented"
+
+
+def _fail_json_loads(raw):
+    raise AssertionError("state.json was parsed instead of read from the cache")
+
+
+def test_load_state_uses_fresh_cache(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    save_state(_make_state(), path)
+    first = load_state(path)
+    assert (tmp_path / "state.pkl").exists()
+    monkeypatch.setattr(state_module, "_json_loads", _fail_json_loads)
+    assert load_state(path) == first
+
+
+def test_load_state_does_not_cache_data_under_a_newer_file(tmp_path, monkeypatch):
+    path = tmp_path / "state.json"
+    save_state(_make_state(), path)
+    json_loads = state_module._json_loads
+
+    def loads_then_replaced(raw):
+        # Another process saves state.json right after this one read it
+        data = json_loads(raw)
+        newer = _make_state()
+        resolve_feature(newer, "s1", "implemented")
+        save_state(newer, path)
+        return data
+
+    monkeypatch.setattr(state_module, "_json_loads", loads_then_replaced)
+    load_state(path)
+    monkeypatch.setattr(state_module, "_json_loads", json_loads)
+    reloaded = load_state(path)
+    assert reloaded["features"]["screen::s1::Food Log"]["status"] == "implemented"
+
+
+def test_load_state_ignores_stale_cache(tmp_path):
+    path = tmp_path / "state.json"
+    state = _make_state()
+    save_state(state, path)
+    load_state(path)  # writes the cache
+    resolve_feature(state, "s1", "implemented")
+    save_state(state, path)
+    reloaded = load_state(path)
+    assert reloaded["features"]["screen::s1::Food Log"]["status"] == "implemented"
+    assert reloaded["stats"]["implemented"] == 2
+
+
+_UNPICKLED_CALLS: list[str] = []
+
+
+def _record_call(value: str) -> dict:
+    _UNPICKLED_CALLS.append(value)
+    return {}
+
+
+class _Exploit:
+    def __reduce__(self):
+        return (_record_call, ("called",))
+
+
+def test_load_state_refuses_cache_with_globals(tmp_path):
+    path = tmp_path / "state.json"
+    save_state(_make_state(), path)
+    expected = load_state(path)
+
+    st = path.stat()
+    (tmp_path / "state.pkl").write_bytes(pickle.dumps(((st.st_mtime_ns, st.st_size), _Exploit())))
+    assert load_state(path) == expected
+    assert _UNPICKLED_CALLS == []
+
+    (tmp_path / "state.pkl").write_bytes(pickle.dumps(((st.st_mtime_ns, st.st_size), expected))[:-20])
+    assert load_state(path) == expected
+
+
+def test_save_state_round_trips_json(tmp_path):
+    path = tmp_path / "state.json"
+    state = _make_state()
+    state["features"]["screen::s1::Food Log"]["detail"]["tags"] = {"b", "a"}
+    state["features"]["screen::s1::Food Log"]["detail"]["kinds"] = frozenset({"y", "x"})
+    state["features"]["screen::s1::Food Log"]["detail"]["page"] = tmp_path / "page.tsx"
+    state["source_file"] = "Café.json"
+    save_state(state, path)
+
+    text = path.read_text(encoding="utf-8")
+    assert text.endswith("}\n")
+    assert "Café.json" in text
+    loaded = load_state(path)
+    detail = loaded["features"]["screen::s1::Food Log"]["detail"]
+    assert detail["tags"] == ["a", "b"]
+    assert detail["kinds"] == ["x", "y"]
+    assert detail["page"] == str(tmp_path / "page.tsx")
+    assert loaded["stats"]["by_tier"]["2"] == {"total": 2, "done": 0}
+
+
+def test_save_state_keeps_previous_file_as_backup(tmp_path):
+    path = tmp_path / "state.json"
+    state = _make_state()
+    save_state(state, path)
+    before = path.read_bytes()
+    resolve_feature(state, "s1", "implemented")
+    save_state(state, path)
+
+    assert (tmp_path / "state.json.bak").read_bytes() == before
+    assert path.read_bytes() != before
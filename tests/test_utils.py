@@ -0,0 +1,25 @@
+"""Tests for shared output helpers."""
+
+import json
+
+from pen_audit import utils
+from pen_audit.utils import dump_json, dump_json_bytes
+
+
+_NON_ASCII = {"tier": "Tier 1 — static", "name": "Café \U0001f600\x7f ", 2: [1.5, None]}
+
+
+def test_dump_json_escapes_non_ascii_like_stdlib(monkeypatch):
+    expected = json.dumps(_NON_ASCII, indent=2)
+    assert dump_json(_NON_ASCII) == expected
+    assert dump_json(_NON_ASCII).isascii()
+    monkeypatch.setattr(utils, "orjson", None)
+    assert dump_json(_NON_ASCII) == expected
+
+
+def test_dump_json_bytes_writes_utf8(monkeypatch):
+    encoded = dump_json_bytes(_NON_ASCII)
+    assert "Café".encode() in encoded
+    assert json.loads(encoded) == json.loads(json.dumps(_NON_ASCII))
+    monkeypatch.setattr(utils, "orjson", None)
+    assert dump_json_bytes(_NON_ASCII) == encoded